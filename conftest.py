@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration
+
+Puts src/ on sys.path once for the whole test session, so test modules
+can import mbti_pet without an installed package.
+"""
+
+import sys
+from pathlib import Path
+
+src_path = Path(__file__).parent / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
@@ -282,30 +282,33 @@ class AutomationAssistant:
         self.engine = AutomationEngine()
         self.library = TaskLibrary()
         self.task_history: List[Dict[str, Any]] = []
+        
+        # The common task set is fixed for the process, so build it once
+        self._tasks: Dict[str, AutomationTask] = {
+            task.name.lower(): task for task in self.library.get_common_tasks()
+        }
+        self._task_names = tuple(task.name for task in self._tasks.values())
     
     def get_available_tasks(self) -> List[str]:
         """Get list of available task names"""
-        tasks = self.library.get_common_tasks()
-        return [task.name for task in tasks]
+        return list(self._task_names)
     
     def execute_task_by_name(self, task_name: str) -> bool:
         """Execute a task by its name"""
-        tasks = self.library.get_common_tasks()
+        task = self._tasks.get(task_name.lower())
+        if task is None:
+            return False
         
-        for task in tasks:
-            if task.name.lower() == task_name.lower():
-                result = self.engine.execute_task(task)
-                
-                # Record in history
-                self.task_history.append({
-                    "task_name": task_name,
-                    "timestamp": time.time(),
-                    "success": result
-                })
-                
-                return result
+        result = self.engine.execute_task(task)
+        
+        # Record in history
+        self.task_history.append({
+            "task_name": task_name,
+            "timestamp": time.time(),
+            "success": result
+        })
         
-        return False
+        return result
     
     def suggest_automation(self, context: Dict[str, Any]) -> Optional[str]:
         """Suggest automation based on context"""
@@ -3,7 +3,9 @@ Configuration management for MBTI Desktop Pet
 """
 
 import os
+import copy
 import json
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -78,6 +80,9 @@ class ConfigManager:
     """Manager for persistent configuration using JSON files"""
     
     DEFAULT_CONFIG_PATH = "./data/config.json"
+    # Files modified more recently than this (2 s, FAT's mtime resolution)
+    # are re-read on every load instead of being served from the cache
+    STABLE_AFTER_NS = 2_000_000_000
     
     def __init__(self, config_path: Optional[str] = None):
         """
@@ -88,23 +93,51 @@ class ConfigManager:
         """
         self.config_path = Path(config_path or self.DEFAULT_CONFIG_PATH)
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        # Last parsed config and the (mtime_ns, size, inode) of the file it came from
+        self._cached_config: Optional[Dict[str, Any]] = None
+        self._cached_stamp: Optional[Tuple[int, int, int]] = None
+    
+    def _file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """Return (mtime_ns, size, inode) of the config file, or None if it doesn't exist"""
+        try:
+            stat = self.config_path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
     
     def load(self) -> Dict[str, Any]:
         """
         Load configuration from JSON file
         
+        The parsed file is cached and only re-read when its modification
+        time, size or inode changes, so repeated getters don't re-parse it.
+        A file modified within STABLE_AFTER_NS is always re-read: on
+        filesystems with coarse timestamps a same-size edit made in the
+        same tick would not move its mtime.
+        
         Returns:
             Dictionary containing configuration data, or empty dict if file doesn't exist
         """
-        if not self.config_path.exists():
+        stamp = self._file_stamp()
+        if stamp is None:
             return {}
         
-        try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Could not load config from {self.config_path}: {e}")
-            return {}
+        if stamp != self._cached_stamp:
+            try:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    self._cached_config = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Warning: Could not load config from {self.config_path}: {e}")
+                self._cached_config, self._cached_stamp = None, None
+                return {}
+            # Only trust the stamp once the file has been left alone for a while
+            if time.time_ns() - stamp[0] >= self.STABLE_AFTER_NS:
+                self._cached_stamp = stamp
+            else:
+                self._cached_stamp = None
+        
+        # Callers modify the returned dict before saving it back
+        return copy.deepcopy(self._cached_config)
     
     def save(self, config: Dict[str, Any]) -> bool:
         """
@@ -117,6 +150,8 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
+            # Re-read on the next load(), so it sees exactly what JSON kept
+            self._cached_config, self._cached_stamp = None, None
             with open(self.config_path, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
             return True
@@ -31,6 +31,8 @@ class MemoryDatabase:
     
     def __init__(self, db_path: str = "./data/memory.db"):
         self.db_path = db_path
+        # Incremented on every write so views can tell when to re-render
+        self.revision = 0
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self._init_database()
     
@@ -92,6 +94,34 @@ class MemoryDatabase:
         
         conn.commit()
         conn.close()
+        self.revision += 1
+    
+    def add_memories(self, memories: List[MemoryEntry]):
+        """Add several memory entries in a single transaction"""
+        if not memories:
+            return
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        cursor.executemany("""
+            INSERT INTO memories (timestamp, interaction_type, content, context, importance, tags)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                memory.timestamp,
+                memory.interaction_type,
+                memory.content,
+                json.dumps(memory.context),
+                memory.importance,
+                json.dumps(memory.tags)
+            )
+            for memory in memories
+        ])
+        
+        conn.commit()
+        conn.close()
+        self.revision += 1
     
     def get_recent_memories(self, limit: int = 10, interaction_type: Optional[str] = None) -> List[MemoryEntry]:
         """Get recent memories, optionally filtered by type"""
@@ -197,6 +227,7 @@ class MemoryDatabase:
         
         conn.commit()
         conn.close()
+        self.revision += 1
     
     def get_patterns(self, pattern_type: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """Get learned user patterns"""
@@ -240,16 +271,16 @@ class MemoryManager:
     def __init__(self, db_path: str = "./data/memory.db"):
         self.db = MemoryDatabase(db_path)
     
-    def record_interaction(
+    def create_entry(
         self,
         interaction_type: str,
         content: str,
         context: Optional[Dict[str, Any]] = None,
         importance: int = 5,
         tags: Optional[List[str]] = None
-    ):
-        """Record a new user interaction"""
-        memory = MemoryEntry(
+    ) -> MemoryEntry:
+        """Create a timestamped memory entry without storing it"""
+        return MemoryEntry(
             timestamp=datetime.now().isoformat(),
             interaction_type=interaction_type,
             content=content,
@@ -257,8 +288,23 @@ class MemoryManager:
             importance=importance,
             tags=tags or []
         )
+    
+    def record_interaction(
+        self,
+        interaction_type: str,
+        content: str,
+        context: Optional[Dict[str, Any]] = None,
+        importance: int = 5,
+        tags: Optional[List[str]] = None
+    ):
+        """Record a new user interaction"""
+        memory = self.create_entry(interaction_type, content, context, importance, tags)
         self.db.add_memory(memory)
     
+    def record_interactions(self, memories: List[MemoryEntry]):
+        """Record a batch of entries (see create_entry) in one transaction"""
+        self.db.add_memories(memories)
+    
     def get_context_for_response(self, query: str, limit: int = 5) -> str:
         """Get relevant context from memory for generating response"""
         memories = self.db.search_memories(query, limit=limit)
@@ -5,7 +5,7 @@ Defines 16 MBTI personality types and their characteristics
 
 from enum import Enum
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class MBTIType(Enum):
@@ -210,14 +210,30 @@ class MBTIPersonality:
     def __init__(self, mbti_type: MBTIType):
         self.type = mbti_type
         self.traits = self.PERSONALITIES[mbti_type]
+        # Traits are static per type, so the formatted pieces are built once
+        self._response_prefix = f"{self.traits.default_emoji} "
+        self._response_suffix = ""
+        self._greeting = f"{self._response_prefix}{self.traits.greeting_style}"
     
     def get_greeting(self) -> str:
         """Get a greeting message based on personality"""
-        return f"{self.traits.default_emoji} {self.traits.greeting_style}"
+        return self._greeting
+    
+    def compiled_template(self) -> Tuple[str, str]:
+        """
+        Get the text format_response wraps around a message
+        
+        Callers formatting many messages at once can concatenate these
+        directly instead of calling format_response per message.
+        
+        Returns:
+            Tuple[str, str]: (prefix, suffix)
+        """
+        return self._response_prefix, self._response_suffix
     
     def format_response(self, message: str) -> str:
         """Format a response based on personality traits"""
-        return f"{self.traits.default_emoji} {message}"
+        return self._response_prefix + message + self._response_suffix
     
     def get_personality_description(self) -> str:
         """Get full personality description"""
@@ -3,34 +3,423 @@ Desktop Pet UI
 PyQt5-based interface for the desktop pet
 """
 
+import os
 import sys
 import logging
+import functools
+import html
 from typing import Optional
+from dataclasses import dataclass
 from datetime import datetime
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
     QTextEdit, QLineEdit, QPushButton, QLabel, QComboBox,
-    QSystemTrayIcon, QMenu, QAction, QListWidget, QListWidgetItem,
-    QScrollArea, QDialog, QDialogButtonBox, QMessageBox
+    QSystemTrayIcon, QMenu, QListWidget, QListView,
+    QDialog, QDialogButtonBox, QMessageBox, QStyledItemDelegate
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QSize, QRect, QRectF, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QAbstractListModel, QModelIndex
+)
+from PyQt5.QtGui import (
+    QIcon, QFont, QFontMetrics, QColor, QPainter, QTextCursor, QTextBlockFormat,
+    QTextCharFormat, QPixmap, QImage, QImageReader
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize
-from PyQt5.QtGui import QIcon, QFont, QTextCursor, QPixmap
 
 from mbti_pet.personality import MBTIPersonality, MBTIType
-from mbti_pet.intent import ContextAwareIntentSystem
+from mbti_pet.intent import ContextAwareIntentSystem, IntentType
 from mbti_pet.memory import MemoryManager
 from mbti_pet.automation import AutomationAssistant
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Personality combo entries, computed once at import
+MBTI_TYPE_NAMES = tuple(mbti_type.value for mbti_type in MBTIType)
+
+
+# Application-wide stylesheet for the chat window and its dialogs.
+# Selectors are scoped to PetWidget so the transparent pet window and the
+# MBTI selection dialog keep their own look. Installed once on the
+# QApplication by install_stylesheet() instead of per widget.
+APP_STYLESHEET = """
+    PetWidget, PetWidget QWidget {
+        background-color: #f5f5f5;
+    }
+    PetWidget QTextEdit {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        padding: 10px;
+        font-size: 14px;
+    }
+    PetWidget QLineEdit {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 14px;
+    }
+    PetWidget QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    PetWidget QPushButton:hover {
+        background-color: #45a049;
+    }
+    PetWidget QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QPushButton#screenshot_button {
+        background-color: #2196F3;
+    }
+    QPushButton#screenshot_button:hover {
+        background-color: #0b7dda;
+    }
+    QPushButton#memory_button {
+        background-color: #9C27B0;
+    }
+    QPushButton#memory_button:hover {
+        background-color: #7B1FA2;
+    }
+    QPushButton#automate_button {
+        background-color: #FF9800;
+    }
+    QPushButton#automate_button:hover {
+        background-color: #F57C00;
+    }
+    QPushButton#execute_button {
+        background-color: #4CAF50;
+        padding: 10px;
+    }
+    QPushButton#execute_button:hover {
+        background-color: #45a049;
+    }
+    QPushButton#close_button {
+        background-color: #f44336;
+        padding: 10px;
+    }
+    QPushButton#close_button:hover {
+        background-color: #da190b;
+    }
+    QLabel#pet_display {
+        padding: 20px;
+    }
+    QLabel#task_info {
+        color: #666;
+        margin: 10px 0;
+    }
+    QLabel#task_status {
+        margin-top: 10px;
+        padding: 5px;
+    }
+    QLabel#task_status[state="running"] {
+        color: blue;
+    }
+    QLabel#task_status[state="success"] {
+        color: green;
+    }
+    QLabel#task_status[state="error"] {
+        color: red;
+    }
+    QListView#chat_display {
+        background-color: #F0F0F0;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+    }
+    PetWidget QComboBox {
+        background-color: white;
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        padding: 5px;
+    }
+    QToolTip {
+        background-color: #333;
+        color: white;
+        border: 1px solid #555;
+        padding: 5px;
+        border-radius: 3px;
+    }
+"""
+
+
+def install_stylesheet():
+    """Install APP_STYLESHEET on the running QApplication (once per process)"""
+    app = QApplication.instance()
+    if app is None or app.property("mbti_pet_stylesheet"):
+        return
+    app.setStyleSheet(app.styleSheet() + APP_STYLESHEET)
+    app.setProperty("mbti_pet_stylesheet", True)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_personality(mbti_str: str) -> MBTIPersonality:
+    """Return a shared MBTIPersonality per type string instead of rebuilding it"""
+    return MBTIPersonality.from_string(mbti_str)
+
+
+@functools.lru_cache(maxsize=16)
+def _helpful_snippet(mbti_type: MBTIType) -> str:
+    """Return the joined top-two helpful traits for a personality type"""
+    return ", ".join(MBTIPersonality.PERSONALITIES[mbti_type].helpful_traits[:2])
+
+
+@functools.lru_cache(maxsize=16)
+def _personality_changed_message(mbti_type: MBTIType) -> str:
+    """Return the chat announcement shown after switching to a personality type"""
+    return f"Personality changed! {_get_personality(mbti_type.value).get_greeting()}"
+
+
+@functools.lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """
+    Return a shared Arial font (resolved against the font database once)
+    
+    QFont needs a QApplication, so fonts are built on first use rather
+    than at import time. QFont is implicitly shared, so handing the same
+    instance to several widgets is safe.
+    """
+    return QFont("Arial", point_size, QFont.Bold if bold else QFont.Normal)
+
+
+def _format_hm(iso_timestamp: str) -> str:
+    """Format a stored ISO timestamp as HH:MM for the chat display"""
+    # Stored timestamps are datetime.isoformat() output (YYYY-MM-DDTHH:MM...),
+    # so HH:MM sits at a fixed offset; anything else goes through a full parse
+    if (len(iso_timestamp) >= 16 and iso_timestamp[10] in "T "
+            and iso_timestamp[13] == ":"):
+        return iso_timestamp[11:16]
+    return datetime.fromisoformat(iso_timestamp).strftime("%H:%M")
+
+
+# Rendered pet emoji, keyed by (emoji, font key, color, device pixel ratio)
+_EMOJI_PIXMAPS = {}
+
+
+def _emoji_pixmap(emoji: str, font: QFont, color: QColor, device_pixel_ratio: float = 1.0) -> QPixmap:
+    """
+    Render an emoji glyph to a transparent pixmap once and reuse it
+    
+    Args:
+        emoji: Emoji text to render
+        font: Font to shape the glyph with
+        color: Pen color for glyphs without their own colors
+        device_pixel_ratio: Screen scale factor, so the pixmap stays sharp
+        
+    Returns:
+        QPixmap: Cached rendering of the emoji
+    """
+    key = (emoji, font.key(), color.rgba(), device_pixel_ratio)
+    pixmap = _EMOJI_PIXMAPS.get(key)
+    if pixmap is None:
+        metrics = QFontMetrics(font)
+        width = max(1, metrics.horizontalAdvance(emoji))
+        height = max(1, metrics.height())
+        pixmap = QPixmap(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(QRect(0, 0, width, height), Qt.AlignCenter, emoji)
+        painter.end()
+        _EMOJI_PIXMAPS[key] = pixmap
+    return pixmap
+
+
+@functools.lru_cache(maxsize=1)
+def _memory_pool() -> QThreadPool:
+    """Single-thread pool for memory I/O, so reads see earlier queued writes"""
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    return pool
+
+
+class TaskWorkerSignals(QObject):
+    """
+    Signals emitted by TaskWorker (QRunnable cannot define signals itself)
+    
+    The holder is created on the GUI thread but emitted from a pool thread,
+    so slots that touch widgets must be connected with Qt.QueuedConnection.
+    """
+    finished = pyqtSignal(str, bool)  # task name, success
+
+
+class TaskWorker(QRunnable):
+    """Runs an automation task on the global thread pool"""
+    
+    def __init__(self, automation_assistant, task_name: str):
+        super().__init__()
+        self.automation = automation_assistant
+        self.task_name = task_name
+        self.signals = TaskWorkerSignals()
+    
+    def execute(self) -> bool:
+        """Execute the task on the pool thread"""
+        return self.automation.execute_task_by_name(self.task_name)
+    
+    def run(self):
+        """Execute the task and report the result back to the GUI thread"""
+        try:
+            success = self.execute()
+        except Exception as e:
+            logger.error(f"Error executing task '{self.task_name}': {e}", exc_info=True)
+            success = False
+        self.signals.finished.emit(self.task_name, success)
+
+
+def _decode_preview(filepath: str, max_width: int, max_height: int) -> Optional[QImage]:
+    """
+    Decode a downscaled preview of an image file
+    
+    Returns a QImage, which unlike QPixmap may be created off the GUI
+    thread. The image is decoded directly at preview resolution with
+    QImageReader.setScaledSize(); small images are never upscaled.
+    
+    Args:
+        filepath: Image file to read
+        max_width: Maximum preview width
+        max_height: Maximum preview height
+        
+    Returns:
+        The preview image, or None if the file is missing or unreadable
+    """
+    if not os.path.exists(filepath):
+        return None
+    
+    reader = QImageReader(filepath)
+    size = reader.size()
+    if size.isValid() and (size.width() > max_width or size.height() > max_height):
+        size.scale(max_width, max_height, Qt.KeepAspectRatio)
+        reader.setScaledSize(size)
+    image = reader.read()
+    if image.isNull():
+        return None
+    
+    if image.width() > max_width or image.height() > max_height:
+        # Format couldn't report its size up front; fall back to a cheap scale
+        image = image.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return image
+
+
+class ScreenshotWorker(TaskWorker):
+    """Takes a screenshot and decodes its preview on the pool thread"""
+    
+    def __init__(self, automation_assistant, filepath: str, preview_size):
+        super().__init__(automation_assistant, "Take Screenshot")
+        self.filepath = filepath
+        self.preview_size = preview_size
+        self.preview = None  # QImage, set before finished is emitted
+    
+    def execute(self) -> bool:
+        """Take the screenshot, then decode its preview"""
+        success = super().execute()
+        if success:
+            try:
+                self.preview = _decode_preview(self.filepath, *self.preview_size)
+            except Exception as e:
+                logger.error(f"Could not load screenshot preview: {e}", exc_info=True)
+        return success
+
+
+class IntentWorkerSignals(QObject):
+    """Signals emitted by IntentWorker"""
+    intent_ready = pyqtSignal(str, object)  # user input, Intent (None on failure)
+
+
+class IntentWorker(QRunnable):
+    """Runs intent recognition for one message off the GUI thread"""
+    
+    def __init__(self, intent_system, user_input: str):
+        super().__init__()
+        self.intent_system = intent_system
+        self.user_input = user_input
+        self.signals = IntentWorkerSignals()
+    
+    def run(self):
+        """Analyze the message and hand the intent back to the GUI thread"""
+        try:
+            intent = self.intent_system.analyze(user_input=self.user_input)
+        except Exception as e:
+            logger.error(f"Error analyzing input: {e}", exc_info=True)
+            intent = None
+        self.signals.intent_ready.emit(self.user_input, intent)
+
+
+class MemoryFlushWorker(QRunnable):
+    """Writes a batch of queued memory entries on the memory pool"""
+    
+    def __init__(self, memory_manager, memories: list):
+        super().__init__()
+        self.memory = memory_manager
+        self.memories = memories
+    
+    def run(self):
+        """Store the batch in a single transaction"""
+        try:
+            self.memory.record_interactions(self.memories)
+        except Exception as e:
+            logger.error(f"Error flushing {len(self.memories)} memories: {e}", exc_info=True)
+
+
+class MemoryLoadWorkerSignals(QObject):
+    """Signals emitted by MemoryLoadWorker"""
+    loaded = pyqtSignal(object)  # snapshot dict, or None if memory is unchanged
+    failed = pyqtSignal(str)  # error message
+
+
+class MemoryLoadWorker(QRunnable):
+    """Reads everything MemoryDialog shows on the memory pool"""
+    
+    def __init__(self, memory_manager, recent_limit: int, known_revision: Optional[int] = None):
+        super().__init__()
+        self.memory = memory_manager
+        self.recent_limit = recent_limit
+        self.known_revision = known_revision
+        self.signals = MemoryLoadWorkerSignals()
+    
+    def run(self):
+        """Query summary, recent memories and patterns unless nothing changed"""
+        try:
+            # Checked here rather than on the GUI thread so that writes queued
+            # on the memory pool before this load are taken into account
+            revision = self.memory.db.revision
+            if revision == self.known_revision:
+                self.signals.loaded.emit(None)
+                return
+            snapshot = {
+                "revision": revision,
+                "summary": self.memory.get_summary(),
+                "recent_memories": self.memory.db.get_recent_memories(limit=self.recent_limit),
+                "patterns": self.memory.get_user_preferences(),
+            }
+        except Exception as e:
+            logger.error(f"Error loading memories: {e}", exc_info=True)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(snapshot)
+
 
 class MemoryDialog(QDialog):
     """Dialog to display memory summary"""
     
+    RECENT_MEMORY_LIMIT = 10  # Upper bound on rendered interaction rows
+    CONTENT_PREVIEW_CHARS = 100  # Characters of content shown per row
+    ROW_HTML = (
+        "<div style='margin: 10px 0; padding: 10px; background: #f0f0f0; border-radius: 5px;'>"
+        "<b>{interaction_type}</b> - <i>{timestamp}</i><br>{content}...</div>"
+    )
+    
     def __init__(self, memory_manager, parent=None):
         super().__init__(parent)
         self.memory = memory_manager
+        self._rendered_revision = None
+        self._loader = None
         self.init_ui()
     
     def init_ui(self):
@@ -42,38 +431,13 @@ class MemoryDialog(QDialog):
         
         # Title
         title_label = QLabel("Memory & Conversation History")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label.setFont(_font(14, bold=True))
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
         # Memory content
         self.memory_display = QTextEdit()
         self.memory_display.setReadOnly(True)
-        
-        # Load and display memory data
-        summary = self.memory.get_summary()
-        recent_memories = self.memory.db.get_recent_memories(limit=10)
-        
-        content = f"<h3>Memory Summary</h3>"
-        content += f"<p>{summary}</p>"
-        content += f"<h3>Recent Interactions</h3>"
-        
-        for mem in recent_memories:
-            content += f"<div style='margin: 10px 0; padding: 10px; background: #f0f0f0; border-radius: 5px;'>"
-            content += f"<b>{mem.interaction_type}</b> - <i>{mem.timestamp}</i><br>"
-            content += f"{mem.content[:100]}..."
-            content += f"</div>"
-        
-        # Get user patterns
-        patterns = self.memory.get_user_preferences()
-        if patterns.get('common_tasks') or patterns.get('frequent_apps'):
-            content += f"<h3>Learned Patterns</h3>"
-            if patterns.get('common_tasks'):
-                content += f"<p><b>Common Tasks:</b> {len(patterns['common_tasks'])} patterns</p>"
-            if patterns.get('frequent_apps'):
-                content += f"<p><b>Frequent Apps:</b> {len(patterns['frequent_apps'])} apps</p>"
-        
-        self.memory_display.setHtml(content)
         layout.addWidget(self.memory_display)
         
         # Close button
@@ -82,15 +446,99 @@ class MemoryDialog(QDialog):
         layout.addWidget(button_box)
         
         self.setLayout(layout)
+    
+    def render_content(self, snapshot: dict):
+        """
+        Render memory data into the display
+        
+        Rows are inserted incrementally through a QTextCursor inside a
+        single edit block instead of re-parsing one large HTML string
+        with setHtml(). Stored text is escaped so user input is shown
+        verbatim rather than parsed as markup.
+        
+        Args:
+            snapshot: Data loaded by MemoryLoadWorker
+        """
+        self._rendered_revision = snapshot["revision"]
+        summary = snapshot["summary"]
+        recent_memories = snapshot["recent_memories"]
+        patterns = snapshot["patterns"]
+        
+        self.memory_display.clear()
+        cursor = self.memory_display.textCursor()
+        cursor.beginEditBlock()
+        
+        def insert_block(markup: str):
+            # Start a fresh block so heading/div formats don't bleed into the next row
+            cursor.insertHtml(markup)
+            cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
+        
+        insert_block("<h3>Memory Summary</h3>")
+        insert_block(f"<p>{html.escape(summary)}</p>")
+        insert_block("<h3>Recent Interactions</h3>")
+        
+        for mem in recent_memories:
+            insert_block(self.ROW_HTML.format(
+                interaction_type=mem.interaction_type,
+                timestamp=mem.timestamp,
+                content=html.escape(mem.content[:self.CONTENT_PREVIEW_CHARS])
+            ))
+        
+        # Learned user patterns
+        common_tasks = patterns.get('common_tasks') or ()
+        frequent_apps = patterns.get('frequent_apps') or ()
+        if common_tasks or frequent_apps:
+            insert_block("<h3>Learned Patterns</h3>")
+            if common_tasks:
+                insert_block(f"<p><b>Common Tasks:</b> {len(common_tasks)} patterns</p>")
+            if frequent_apps:
+                insert_block(f"<p><b>Frequent Apps:</b> {len(frequent_apps)} apps</p>")
+        
+        cursor.endEditBlock()
+        self.memory_display.moveCursor(QTextCursor.Start)
+    
+    def refresh(self):
+        """Reload in the background; re-renders only if memory has been written"""
+        if self._loader is not None:
+            return
+        if self._rendered_revision is None:
+            self.memory_display.setPlainText("Loading memories...")
+        self._loader = MemoryLoadWorker(self.memory, self.RECENT_MEMORY_LIMIT, self._rendered_revision)
+        self._loader.signals.loaded.connect(self.on_content_loaded, Qt.QueuedConnection)
+        self._loader.signals.failed.connect(self.on_load_failed, Qt.QueuedConnection)
+        _memory_pool().start(self._loader)
+    
+    def on_content_loaded(self, snapshot):
+        """Render a finished load (None means nothing changed since the last one)"""
+        self._loader = None
+        if snapshot is None:
+            return
+        self.render_content(snapshot)
+        # Memory may have been written while the load was running
+        if self.isVisible() and self.memory.db.revision != self._rendered_revision:
+            self.refresh()
+    
+    def on_load_failed(self, message: str):
+        """Show a load error in place of the memory data"""
+        self._loader = None
+        self._rendered_revision = None
+        self.memory_display.setPlainText(f"Error loading memories: {message}")
+    
+    def showEvent(self, event):
+        """Load memory data when the dialog is shown rather than when it is built"""
+        self.refresh()
+        super().showEvent(event)
 
 
 class AutomationDialog(QDialog):
     """Dialog to display and execute automation tasks"""
     
+    task_completed = pyqtSignal(str, bool)  # task name, success
+    
     def __init__(self, automation_assistant, parent=None):
         super().__init__(parent)
         self.automation = automation_assistant
-        self.parent_widget = parent
+        self._worker = None
         self.init_ui()
     
     def init_ui(self):
@@ -102,54 +550,33 @@ class AutomationDialog(QDialog):
         
         # Title
         title_label = QLabel("Available Automation Tasks")
-        title_label.setFont(QFont("Arial", 14, QFont.Bold))
+        title_label.setFont(_font(14, bold=True))
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
         # Instructions
         info_label = QLabel("Select a task and click 'Execute' to run it:")
-        info_label.setStyleSheet("color: #666; margin: 10px 0;")
+        info_label.setObjectName("task_info")
         layout.addWidget(info_label)
         
         # Task list
         self.task_list = QListWidget()
-        tasks = self.automation.get_available_tasks()
-        
-        for task_name in tasks:
-            self.task_list.addItem(task_name)
-        
         layout.addWidget(self.task_list)
         
         # Buttons
         button_layout = QHBoxLayout()
         
         self.execute_button = QPushButton("Execute Task")
+        self.execute_button.setObjectName("execute_button")
         self.execute_button.clicked.connect(self.execute_selected_task)
-        self.execute_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        
+        # Only offer execution once a task is selected
+        self.task_list.itemSelectionChanged.connect(self.update_execute_button)
+        self.refresh_tasks()
         
         close_button = QPushButton("Close")
+        close_button.setObjectName("close_button")
         close_button.clicked.connect(self.accept)
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                padding: 10px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-        """)
         
         button_layout.addWidget(self.execute_button)
         button_layout.addWidget(close_button)
@@ -157,123 +584,255 @@ class AutomationDialog(QDialog):
         
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("margin-top: 10px; padding: 5px;")
+        self.status_label.setObjectName("task_status")
+        # Status text embeds task names; never sniff it for rich text
+        self.status_label.setTextFormat(Qt.PlainText)
         layout.addWidget(self.status_label)
         
         self.setLayout(layout)
     
+    def refresh_tasks(self):
+        """(Re)load the available task names into the task list"""
+        self.task_list.clear()
+        self.task_list.addItems(self.automation.get_available_tasks())
+        self.update_execute_button()
+    
+    def reset_status(self):
+        """Clear the status line left over from a previous execution"""
+        if self._worker is None:
+            self.set_status("")
+    
+    def set_status(self, text: str, state: str = ""):
+        """
+        Show a status message styled by the shared stylesheet
+        
+        Args:
+            text: Status text to display
+            state: One of "running", "success", "error" or "" (plain)
+        """
+        self.status_label.setText(text)
+        if self.status_label.property("state") != state:
+            # Dynamic property selectors are only re-evaluated on repolish
+            self.status_label.setProperty("state", state)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
+    
+    def update_execute_button(self):
+        """Enable the execute button only for a selected task when idle"""
+        self.execute_button.setEnabled(
+            self._worker is None and self.task_list.currentItem() is not None
+        )
+    
     def execute_selected_task(self):
         """Execute the selected automation task"""
         current_item = self.task_list.currentItem()
-        if not current_item:
-            self.status_label.setText("⚠️ Please select a task first!")
-            self.status_label.setStyleSheet("color: orange; margin-top: 10px; padding: 5px;")
+        if current_item is None or self._worker is not None:
             return
         
         task_name = current_item.text()
-        self.status_label.setText(f"⏳ Executing '{task_name}'...")
-        self.status_label.setStyleSheet("color: blue; margin-top: 10px; padding: 5px;")
-        QApplication.processEvents()  # Update UI
+        self.set_status(f"⏳ Executing '{task_name}'...", "running")
+        self.execute_button.setEnabled(False)
         
-        # Execute the task
-        success = self.automation.execute_task_by_name(task_name)
+        # Execute the task off the GUI thread; the result comes back via signal
+        self._worker = TaskWorker(self.automation, task_name)
+        self._worker.signals.finished.connect(self.on_task_finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._worker)
+    
+    def on_task_finished(self, task_name: str, success: bool):
+        """Update the dialog once a background task has completed"""
+        self._worker = None
+        self.update_execute_button()
         
         if success:
-            self.status_label.setText(f"✅ '{task_name}' executed successfully!")
-            self.status_label.setStyleSheet("color: green; margin-top: 10px; padding: 5px;")
-            
-            # Notify parent widget if available
-            if self.parent_widget and hasattr(self.parent_widget, 'add_message'):
-                self.parent_widget.add_message(
-                    "Pet", 
-                    f"✅ Automation task '{task_name}' completed successfully!"
-                )
+            self.set_status(f"✅ '{task_name}' executed successfully!", "success")
         else:
-            self.status_label.setText(f"❌ Failed to execute '{task_name}'")
-            self.status_label.setStyleSheet("color: red; margin-top: 10px; padding: 5px;")
-            
-            # Notify parent widget if available
-            if self.parent_widget and hasattr(self.parent_widget, 'add_message'):
-                self.parent_widget.add_message(
-                    "Pet", 
-                    f"❌ Failed to execute automation task '{task_name}'"
-                )
+            self.set_status(f"❌ Failed to execute '{task_name}'", "error")
+        
+        self.task_completed.emit(task_name, success)
+
 
+@dataclass
+class ChatMessage:
+    """A single message shown in the chat display"""
+    sender: str
+    message: str
+    timestamp: str
+    is_user: bool = False
 
-class MessageWidget(QWidget):
-    """Custom widget for displaying a single chat message"""
+
+class ChatModel(QAbstractListModel):
+    """Append-only list of chat messages, capped at max_messages"""
     
-    def __init__(self, sender: str, message: str, timestamp: str, is_user: bool = False):
-        super().__init__()
-        self.sender = sender
-        self.message = message
-        self.timestamp = timestamp
-        self.is_user = is_user
-        self.init_ui()
+    MESSAGE_ROLE = Qt.UserRole
     
-    def init_ui(self):
-        """Initialize the message widget UI"""
-        layout = QHBoxLayout()
-        layout.setContentsMargins(10, 5, 10, 5)
-        
-        # Create message container
-        message_container = QWidget()
-        message_layout = QVBoxLayout()
-        message_layout.setContentsMargins(12, 8, 12, 8)
-        message_layout.setSpacing(4)
-        
-        # Sender and timestamp row
-        header_layout = QHBoxLayout()
-        sender_label = QLabel(self.sender)
-        sender_label.setFont(QFont("Arial", 10, QFont.Bold))
+    def __init__(self, max_messages: int, parent=None):
+        super().__init__(parent)
+        self.max_messages = max_messages
+        self._messages = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._messages)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        message = self._messages[index.row()]
+        if role == self.MESSAGE_ROLE:
+            return message
+        if role == Qt.DisplayRole:
+            return message.message
+        return None
+    
+    def flags(self, index):
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+    
+    def append_message(self, message: ChatMessage):
+        """Append a message, dropping the oldest one once the model is full"""
+        if len(self._messages) >= self.max_messages:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            del self._messages[0]
+            self.endRemoveRows()
+        
+        row = len(self._messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._messages.append(message)
+        self.endInsertRows()
+    
+    def set_messages(self, messages: list):
+        """Replace all messages in one model reset (keeps the newest max_messages)"""
+        self.beginResetModel()
+        self._messages = list(messages[-self.max_messages:])
+        self.endResetModel()
+
+
+class ChatDelegate(QStyledItemDelegate):
+    """
+    Paints chat messages as bubbles straight from ChatModel data
+    
+    No per-message widgets are built; each row is measured and drawn from
+    its ChatMessage.
+    """
+    
+    # Geometry (pixels)
+    ROW_MARGIN_H = 10
+    ROW_MARGIN_V = 5
+    PADDING_H = 12
+    PADDING_V = 8
+    SPACING = 4
+    HEADER_GAP = 6
+    RADIUS = 10
+    MAX_BUBBLE_WIDTH = 400
+    
+    LAYOUT_CACHE_SIZE = 256  # Measured bubbles kept (per message and width)
+    
+    # (background, border, sender color) for user and pet messages
+    USER_COLORS = (QColor("#DCF8C6"), None, QColor("#075E54"))
+    PET_COLORS = (QColor("#FFFFFF"), QColor("#E0E0E0"), QColor("#128C7E"))
+    TIME_COLOR = QColor("#666666")
+    TEXT_COLOR = QColor("#000000")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Fonts and metrics are reused by every paint and sizeHint call
+        self._font_sender = _font(10, bold=True)
+        self._font_time = _font(9)
+        self._font_msg = _font(11)
+        self._metrics_sender = QFontMetrics(self._font_sender)
+        self._metrics_time = QFontMetrics(self._font_time)
+        self._metrics_msg = QFontMetrics(self._font_msg)
+        self._header_height = max(self._metrics_sender.height(), self._metrics_time.height())
+        # sizeHint runs for every row on each relayout (e.g. while resizing);
+        # text measurement only depends on the strings and the wrap width
+        self._measure = functools.lru_cache(maxsize=self.LAYOUT_CACHE_SIZE)(self._measure_uncached)
+    
+    def _available_width(self, option) -> int:
+        """Width of the row being laid out"""
+        view = self.parent()
+        if view is not None:
+            return view.viewport().width()
+        return option.rect.width()
+    
+    def _bubble_layout(self, data: ChatMessage, row_width: int):
+        """
+        Measure a message bubble
         
-        time_label = QLabel(self.timestamp)
-        time_label.setFont(QFont("Arial", 9))
-        time_label.setStyleSheet("color: #666;")
+        Args:
+            data: Message to measure
+            row_width: Width of the row the bubble is drawn in
+            
+        Returns:
+            tuple: (bubble QSize, body text QRect relative to the text origin)
+        """
+        max_text_width = max(1, min(self.MAX_BUBBLE_WIDTH, row_width - 2 * self.ROW_MARGIN_H)
+                             - 2 * self.PADDING_H)
+        return self._measure(data.sender, data.timestamp, data.message, max_text_width)
+    
+    def _measure_uncached(self, sender: str, timestamp: str, message: str, max_text_width: int):
+        """Measure a bubble for a given wrap width (see _bubble_layout)"""
+        header_width = (self._metrics_sender.horizontalAdvance(sender) + self.HEADER_GAP
+                        + self._metrics_time.horizontalAdvance(timestamp))
+        body = self._metrics_msg.boundingRect(
+            0, 0, max_text_width, 1 << 20, Qt.TextWordWrap, message
+        )
+        text_width = min(max(header_width, body.width()), max_text_width)
+        size = QSize(
+            text_width + 2 * self.PADDING_H,
+            self._header_height + self.SPACING + body.height() + 2 * self.PADDING_V
+        )
+        return size, body
+    
+    def sizeHint(self, option, index):
+        data = index.data(ChatModel.MESSAGE_ROLE)
+        if data is None:
+            return super().sizeHint(option, index)
+        row_width = self._available_width(option)
+        size, _ = self._bubble_layout(data, row_width)
+        return QSize(row_width, size.height() + 2 * self.ROW_MARGIN_V)
+    
+    def paint(self, painter, option, index):
+        data = index.data(ChatModel.MESSAGE_ROLE)
+        if data is None:
+            super().paint(painter, option, index)
+            return
         
-        header_layout.addWidget(sender_label)
-        header_layout.addWidget(time_label)
-        header_layout.addStretch()
+        rect = option.rect
+        size, body = self._bubble_layout(data, rect.width())
+        background, border, sender_color = self.USER_COLORS if data.is_user else self.PET_COLORS
         
-        # Message content
-        message_label = QLabel(self.message)
-        message_label.setWordWrap(True)
-        message_label.setFont(QFont("Arial", 11))
-        message_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        
-        message_layout.addLayout(header_layout)
-        message_layout.addWidget(message_label)
-        
-        message_container.setLayout(message_layout)
-        
-        # Style based on sender
-        if self.is_user:
-            # User message - right aligned with green background
-            message_container.setStyleSheet("""
-                QWidget {
-                    background-color: #DCF8C6;
-                    border-radius: 10px;
-                    max-width: 400px;
-                }
-            """)
-            sender_label.setStyleSheet("color: #075E54;")
-            layout.addStretch()
-            layout.addWidget(message_container)
+        # User messages hug the right edge, pet messages the left
+        if data.is_user:
+            left = rect.right() + 1 - self.ROW_MARGIN_H - size.width()
         else:
-            # Pet message - left aligned with white background
-            message_container.setStyleSheet("""
-                QWidget {
-                    background-color: #FFFFFF;
-                    border: 1px solid #E0E0E0;
-                    border-radius: 10px;
-                    max-width: 400px;
-                }
-            """)
-            sender_label.setStyleSheet("color: #128C7E;")
-            layout.addWidget(message_container)
-            layout.addStretch()
+            left = rect.left() + self.ROW_MARGIN_H
+        bubble = QRect(left, rect.top() + self.ROW_MARGIN_V, size.width(), size.height())
         
-        self.setLayout(layout)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(border if border is not None else Qt.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(QRectF(bubble).adjusted(0.5, 0.5, -0.5, -0.5), self.RADIUS, self.RADIUS)
+        
+        # Sender and timestamp row
+        x = bubble.left() + self.PADDING_H
+        y = bubble.top() + self.PADDING_V
+        text_width = size.width() - 2 * self.PADDING_H
+        painter.setFont(self._font_sender)
+        painter.setPen(sender_color)
+        painter.drawText(QRect(x, y, text_width, self._header_height),
+                         Qt.AlignLeft | Qt.AlignVCenter, data.sender)
+        time_x = self._metrics_sender.horizontalAdvance(data.sender) + self.HEADER_GAP
+        painter.setFont(self._font_time)
+        painter.setPen(self.TIME_COLOR)
+        painter.drawText(QRect(x + time_x, y, max(0, text_width - time_x), self._header_height),
+                         Qt.AlignLeft | Qt.AlignVCenter, data.timestamp)
+        
+        # Message content (drawn as plain text, never interpreted as HTML)
+        painter.setFont(self._font_msg)
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawText(QRect(x, y + self._header_height + self.SPACING, text_width, body.height()),
+                         Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, data.message)
+        painter.restore()
 
 
 class PetWidget(QWidget):
@@ -281,27 +840,86 @@ class PetWidget(QWidget):
     
     # Configuration constants
     MESSAGE_HISTORY_LIMIT = 20  # Maximum number of historical messages to load
+    MAX_CHAT_ITEMS = MESSAGE_HISTORY_LIMIT * 2  # Messages kept in chat_display
+    MEMORY_FLUSH_INTERVAL_MS = 500  # Delay before queued memory writes are flushed
+    SCREENSHOT_FILEPATH = "screenshot.png"  # Where the screenshot task saves
+    SCREENSHOT_PREVIEW_SIZE = (400, 300)  # Bounding box for screenshot previews
+    
+    # Intent-specific additions to the base response: (base, MBTIType) -> str
+    _RESPONSE_BUILDERS = {
+        IntentType.HELP_REQUEST: lambda base, mbti_type: (
+            f"{base} I'm particularly good at {_helpful_snippet(mbti_type)}."
+        ),
+        IntentType.AUTOMATION_REQUEST: lambda base, mbti_type: (
+            f"{base} I can automate many tasks for you!"
+        ),
+    }
     
     def __init__(self):
         super().__init__()
+        install_stylesheet()
         
-        # Initialize components
-        self.personality = MBTIPersonality.from_string("ENFP")
-        self.intent_system = ContextAwareIntentSystem()
-        self.memory = MemoryManager()
-        self.automation = AutomationAssistant()
+        # Initialize components; the subsystems below are built on first use
+        self.personality = _get_personality("ENFP")
+        self._intent_system = None
+        self._memory = None
+        self._automation = None
         
         # Sending state management
         self.is_sending = False
         
+        # Intent recognition runs here, one message at a time, in send order
+        self._intent_pool = QThreadPool(self)
+        self._intent_pool.setMaxThreadCount(1)
+        
+        # Background screenshot worker (kept alive until it reports back)
+        self._screenshot_worker = None
+        
+        # Scrolls requested by back-to-back inserts collapse into one
+        self._scroll_pending = False
+        
+        # Dialogs are built on first use and reused afterwards
+        self._memory_dialog = None
+        self._automation_dialog = None
+        
+        # Memory writes are queued and flushed in batches off the GUI thread
+        self._pending_memory = []
+        self._memory_flush_timer = QTimer(self)
+        self._memory_flush_timer.setSingleShot(True)
+        self._memory_flush_timer.setInterval(self.MEMORY_FLUSH_INTERVAL_MS)
+        self._memory_flush_timer.timeout.connect(self._flush_memory)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_memory_now)
+        
         self.init_ui()
         
+    @property
+    def intent_system(self) -> ContextAwareIntentSystem:
+        """Intent recognizer, built on first use"""
+        if self._intent_system is None:
+            self._intent_system = ContextAwareIntentSystem()
+        return self._intent_system
+    
+    @property
+    def memory(self) -> MemoryManager:
+        """Memory store, opened on first use"""
+        if self._memory is None:
+            self._memory = MemoryManager()
+        return self._memory
+    
+    @property
+    def automation(self) -> AutomationAssistant:
+        """Automation assistant, built on first use"""
+        if self._automation is None:
+            self._automation = AutomationAssistant()
+        return self._automation
+    
     def init_ui(self):
         """Initialize the UI"""
         # Window settings
         self.setWindowTitle("MBTI Desktop Pet")
         self.setGeometry(100, 100, 600, 700)
-        self.setWindowFlags(Qt.WindowStaysOnTopHint)
         
         # Main layout
         main_layout = QVBoxLayout()
@@ -312,8 +930,10 @@ class PetWidget(QWidget):
         # Personality selector
         personality_label = QLabel("Personality:")
         self.personality_combo = QComboBox()
-        for mbti_type in MBTIType:
-            self.personality_combo.addItem(mbti_type.value)
+        self.personality_combo.addItems(MBTI_TYPE_NAMES)
+        # Select the active type before connecting, so populating the combo
+        # never triggers change_personality
+        self.personality_combo.setCurrentText(self.personality.type.value)
         self.personality_combo.currentTextChanged.connect(self.change_personality)
         
         header_layout.addWidget(personality_label)
@@ -322,38 +942,26 @@ class PetWidget(QWidget):
         
         # Pet display area
         self.pet_display = QLabel()
-        self.pet_display.setFont(QFont("Arial", 48))
+        self.pet_display.setFont(_font(48))
         self.pet_display.setAlignment(Qt.AlignCenter)
-        self.pet_display.setStyleSheet("padding: 20px;")
+        self.pet_display.setObjectName("pet_display")
         self.update_pet_display()
         
-        # Chat display - using QListWidget for better message management
-        self.chat_display = QListWidget()
-        self.chat_display.setVerticalScrollMode(QListWidget.ScrollPerPixel)
+        # Chat display - a list view over an append-only message model
+        self.chat_model = ChatModel(self.MAX_CHAT_ITEMS, self)
+        self.chat_display = QListView()
+        self.chat_display.setModel(self.chat_model)
+        self.chat_display.setVerticalScrollMode(QListView.ScrollPerPixel)
         self.chat_display.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.chat_display.setMinimumHeight(300)
-        self.chat_display.setStyleSheet("""
-            QListWidget {
-                background-color: #F0F0F0;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-            }
-            QListWidget::item {
-                background-color: transparent;
-                border: none;
-                padding: 0px;
-            }
-            QListWidget::item:selected {
-                background-color: transparent;
-            }
-        """)
-        
-        # Load message history from memory
-        self.load_message_history()
+        self.chat_display.setObjectName("chat_display")
+        # Messages are painted by ChatDelegate; re-measure them when the width changes
+        self.chat_display.setItemDelegate(ChatDelegate(self.chat_display))
+        self.chat_display.setResizeMode(QListView.Adjust)
         
-        # Add greeting message
-        greeting = self.personality.get_greeting()
-        self.add_message("Pet", greeting, is_user=False)
+        # Fill the chat after the first event-loop pass so the window can
+        # be shown before the memory database is opened and queried
+        QTimer.singleShot(0, self.populate_chat)
         
         # Input area
         input_layout = QHBoxLayout()
@@ -403,77 +1011,32 @@ class PetWidget(QWidget):
         
         self.setLayout(main_layout)
         
-        # Style
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f5f5f5;
-            }
-            QTextEdit {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                padding: 10px;
-                font-size: 14px;
-            }
-            QLineEdit {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QPushButton#screenshot_button {
-                background-color: #2196F3;
-            }
-            QPushButton#screenshot_button:hover {
-                background-color: #0b7dda;
-            }
-            QPushButton#memory_button {
-                background-color: #9C27B0;
-            }
-            QPushButton#memory_button:hover {
-                background-color: #7B1FA2;
-            }
-            QPushButton#automate_button {
-                background-color: #FF9800;
-            }
-            QPushButton#automate_button:hover {
-                background-color: #F57C00;
-            }
-            QComboBox {
-                background-color: white;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QToolTip {
-                background-color: #333;
-                color: white;
-                border: 1px solid #555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-        """)
+    def set_always_on_top(self, enabled: bool):
+        """
+        Keep the window above other windows (off by default)
         
+        Args:
+            enabled: Whether to set Qt.WindowStaysOnTopHint
+        """
+        if bool(self.windowFlags() & Qt.WindowStaysOnTopHint) == enabled:
+            return
+        visible = self.isVisible()
+        self.setWindowFlag(Qt.WindowStaysOnTopHint, enabled)
+        # Changing window flags hides the window; bring it back if it was shown
+        if visible:
+            self.show()
+    
     def update_pet_display(self):
         """Update pet emoji display based on current personality"""
         emoji = self.personality.traits.default_emoji
-        self.pet_display.setText(emoji)
+        # The glyph is shaped once per emoji and then shown as a cached pixmap
+        self.pet_display.setPixmap(_emoji_pixmap(
+            emoji,
+            self.pet_display.font(),
+            self.pet_display.palette().color(self.pet_display.foregroundRole()),
+            self.pet_display.devicePixelRatioF()
+        ))
+        self.pet_display.setAccessibleName(emoji)
         
     def change_personality(self, mbti_type_str: str):
         """
@@ -482,11 +1045,10 @@ class PetWidget(QWidget):
         Args:
             mbti_type_str: MBTI type string (e.g., "ENFP", "INTJ")
         """
-        self.personality = MBTIPersonality.from_string(mbti_type_str)
+        self.personality = _get_personality(mbti_type_str)
         self.update_pet_display()
         
-        greeting = self.personality.get_greeting()
-        self.add_message("Pet", f"Personality changed! {greeting}", is_user=False)
+        self.add_message("Pet", _personality_changed_message(self.personality.type), is_user=False)
         
     def add_message(self, sender: str, message: str, is_user: bool = False, timestamp: Optional[str] = None):
         """Add a message to chat display with timestamp and proper styling"""
@@ -494,40 +1056,52 @@ class PetWidget(QWidget):
         if timestamp is None:
             timestamp = datetime.now().strftime("%H:%M")
         
-        # Create message widget
-        message_widget = MessageWidget(sender, message, timestamp, is_user)
-        
-        # Create list item
-        item = QListWidgetItem(self.chat_display)
-        item.setSizeHint(message_widget.sizeHint())
-        
-        # Add to list
-        self.chat_display.addItem(item)
-        self.chat_display.setItemWidget(item, message_widget)
+        # The model drops the oldest message once it is full
+        self.chat_model.append_message(ChatMessage(sender, message, timestamp, is_user))
         
         # Auto-scroll to bottom
+        self.schedule_scroll_to_bottom()
+    
+    def schedule_scroll_to_bottom(self):
+        """Scroll the chat to the newest message on the next event-loop pass"""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(0, self._do_scroll)
+    
+    def _do_scroll(self):
+        """Perform the scroll queued by schedule_scroll_to_bottom()"""
+        self._scroll_pending = False
         self.chat_display.scrollToBottom()
     
+    def populate_chat(self):
+        """Load the message history, then greet the user"""
+        self.load_message_history()
+        self.add_message("Pet", self.personality.get_greeting(), is_user=False)
+    
     def load_message_history(self):
         """Load recent message history from memory system"""
         try:
             # Get recent conversation history from memory
             recent_memories = self.memory.db.get_recent_memories(limit=self.MESSAGE_HISTORY_LIMIT)
             
-            # Display historical messages
+            # Build the rows first, then publish them to the view in one reset
+            messages = []
+            prefix, suffix = self.personality.compiled_template()
             for memory in reversed(recent_memories):  # Reverse to show oldest first
                 if memory.interaction_type == "text_input":
                     # User message
-                    timestamp = datetime.fromisoformat(memory.timestamp).strftime("%H:%M")
-                    self.add_message("You", memory.content, is_user=True, timestamp=timestamp)
+                    messages.append(ChatMessage("You", memory.content, _format_hm(memory.timestamp), True))
                 elif memory.interaction_type == "response":
                     # Pet response
-                    timestamp = datetime.fromisoformat(memory.timestamp).strftime("%H:%M")
-                    formatted_response = self.personality.format_response(memory.content)
-                    self.add_message("Pet", formatted_response, is_user=False, timestamp=timestamp)
+                    formatted_response = f"{prefix}{memory.content}{suffix}"
+                    messages.append(ChatMessage("Pet", formatted_response, _format_hm(memory.timestamp), False))
+            
+            self.chat_model.set_messages(messages)
+            self.schedule_scroll_to_bottom()
         except Exception as e:
             # If loading history fails, just continue without history
             print(f"Could not load message history: {e}")
+    
     def send_message(self):
         """
         Handle sending user message
@@ -536,12 +1110,10 @@ class PetWidget(QWidget):
         1. Validates input
         2. Displays user message
         3. Disables send button to prevent duplicate sends
-        4. Recognizes intent using the intent system
-        5. Records interaction in memory
-        6. Generates response using MBTI personality
-        7. Displays response
-        8. Re-enables send button
-        9. Handles any errors gracefully
+        4. Recognizes intent on a worker thread (see on_intent_ready)
+        
+        The response is generated, displayed and recorded in
+        on_intent_ready, which also re-enables the send button.
         """
         # Get user input
         user_input = self.input_field.text().strip()
@@ -550,48 +1122,41 @@ class PetWidget(QWidget):
         if not user_input:
             return
         
-        # Display user message
-        self.add_message("You", user_input, is_user=True)
-        self.input_field.clear()
+        # Prevent duplicate sends while processing
+        if self.is_sending:
+            return
         
-        # Recognize intent
-        intent = self.intent_system.analyze(user_input=user_input)
+        # Set sending state
+        self.is_sending = True
+        self.send_button.setEnabled(False)
+        self.send_button.setText("Sending...")
+        self.input_field.setEnabled(False)
         
-        # Record in memory
-        self.memory.record_interaction(
-            interaction_type="text_input",
-            content=user_input,
-            context={"intent": intent.intent_type.value},
-            importance=7
-        )
+        # Display user message
+        self.add_message("You", user_input, is_user=True)
         
-        # Generate response
-        response = self.generate_response(intent)
-        pet_response = self.personality.format_response(response)
+        # Clear input field immediately after displaying
+        self.input_field.clear()
         
-        self.add_message("Pet", pet_response, is_user=False)
-        # Prevent duplicate sends while processing
-        if self.is_sending:
-            return
+        # Recognize intent off the GUI thread; the result comes back via signal
+        worker = IntentWorker(self.intent_system, user_input)
+        worker.signals.intent_ready.connect(self.on_intent_ready, Qt.QueuedConnection)
+        self._intent_pool.start(worker)
+    
+    def on_intent_ready(self, user_input: str, intent):
+        """
+        Respond to a message once its intent has been recognized
         
+        Args:
+            user_input: The message that was analyzed
+            intent: The recognized Intent, or None if analysis failed
+        """
         try:
-            # Set sending state
-            self.is_sending = True
-            self.send_button.setEnabled(False)
-            self.send_button.setText("Sending...")
-            self.input_field.setEnabled(False)
-            
-            # Display user message
-            self.add_message("You", user_input)
-            
-            # Clear input field immediately after displaying
-            self.input_field.clear()
-            
-            # Recognize intent using the context-aware intent system
-            intent = self.intent_system.analyze(user_input=user_input)
+            if intent is None:
+                raise RuntimeError("intent recognition failed")
             
             # Record user input in memory system
-            self.memory.record_interaction(
+            self._queue_memory(
                 interaction_type="text_input",
                 content=user_input,
                 context={"intent": intent.intent_type.value},
@@ -606,7 +1171,7 @@ class PetWidget(QWidget):
             self.add_message("Pet", pet_response)
             
             # Record response in memory system
-            self.memory.record_interaction(
+            self._queue_memory(
                 interaction_type="response",
                 content=response,
                 importance=5
@@ -628,7 +1193,41 @@ class PetWidget(QWidget):
             self.input_field.setEnabled(True)
             # Keep focus on input field for convenience
             self.input_field.setFocus()
+    
+    def _queue_memory(self, **kwargs):
+        """Queue an interaction for the next batched memory flush"""
+        self._pending_memory.append(self.memory.create_entry(**kwargs))
+        if not self._memory_flush_timer.isActive():
+            self._memory_flush_timer.start()
+    
+    def _flush_memory(self, wait: bool = False):
+        """
+        Write all queued interactions in one transaction
         
+        Args:
+            wait: Write synchronously instead of on the memory pool (used
+                on shutdown)
+        """
+        self._memory_flush_timer.stop()
+        if not self._pending_memory:
+            return
+        
+        batch, self._pending_memory = self._pending_memory, []
+        worker = MemoryFlushWorker(self.memory, batch)
+        if wait:
+            worker.run()
+        else:
+            _memory_pool().start(worker)
+    
+    def _flush_memory_now(self):
+        """Synchronously flush queued memory writes (shutdown hook)"""
+        self._flush_memory(wait=True)
+    
+    def closeEvent(self, event):
+        """Flush queued memory writes before the window goes away"""
+        self._flush_memory_now()
+        super().closeEvent(event)
+    
     def generate_response(self, intent) -> str:
         """
         Generate response based on intent and personality
@@ -643,43 +1242,28 @@ class PetWidget(QWidget):
         base_response = intent.suggested_action or "I'm here to help!"
         
         # Add personality-specific touch
-        traits = self.personality.traits
-        
-        if intent.intent_type.value == "help_request":
-            return f"{base_response} I'm particularly good at {', '.join(traits.helpful_traits[:2])}."
-        elif intent.intent_type.value == "automation_request":
-            return f"{base_response} I can automate many tasks for you!"
-        else:
+        builder = self._RESPONSE_BUILDERS.get(intent.intent_type)
+        if builder is None:
             return base_response
+        return builder(base_response, self.personality.type)
     
     def take_screenshot(self):
-        """Take a screenshot"""
-        success = self.automation.execute_task_by_name("Take Screenshot")
-        
-        if success:
-            message = "Screenshot taken successfully! 📸"
-        else:
-            message = "Failed to take screenshot. 😔"
-        
-        self.add_message("Pet", self.personality.format_response(message), is_user=False)
-        
-    def show_memory(self):
-        """Show memory summary"""
-        summary = self.memory.get_summary()
-        self.add_message("Pet", self.personality.format_response(f"Memory Summary:\n{summary}"), is_user=False)
-        
-    def show_automation(self):
-        """Show automation options"""
-        tasks = self.automation.get_available_tasks()
-        task_list = "\n".join([f"- {task}" for task in tasks])
+        """Take a screenshot on a worker thread"""
+        self.screenshot_button.setEnabled(False)
+        self._screenshot_worker = ScreenshotWorker(
+            self.automation, self.SCREENSHOT_FILEPATH, self.SCREENSHOT_PREVIEW_SIZE
+        )
+        self._screenshot_worker.signals.finished.connect(self.on_screenshot_finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._screenshot_worker)
+    
+    def on_screenshot_finished(self, task_name: str, success: bool):
+        """Report the screenshot result once the worker has finished"""
+        self.screenshot_button.setEnabled(True)
+        worker, self._screenshot_worker = self._screenshot_worker, None
         
-        message = f"Available automations:\n{task_list}"
-        self.add_message("Pet", self.personality.format_response(message), is_user=False)
         try:
-            success = self.automation.execute_task_by_name("Take Screenshot")
-            
             if success:
-                filepath = "screenshot.png"
+                filepath = worker.filepath
                 message = f"Screenshot taken successfully! 📸\nSaved to: {filepath}"
                 
                 # Show success message box with preview option
@@ -688,17 +1272,9 @@ class PetWidget(QWidget):
                 msg_box.setText(message)
                 msg_box.setIcon(QMessageBox.Information)
                 
-                # Try to show preview if file exists
-                try:
-                    import os
-                    if os.path.exists(filepath):
-                        pixmap = QPixmap(filepath)
-                        if not pixmap.isNull():
-                            # Scale down for preview
-                            scaled_pixmap = pixmap.scaled(400, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                            msg_box.setIconPixmap(scaled_pixmap)
-                except Exception as e:
-                    print(f"Could not load screenshot preview: {e}")
+                # The preview was decoded on the worker thread
+                if worker.preview is not None:
+                    msg_box.setIconPixmap(QPixmap.fromImage(worker.preview))
                 
                 msg_box.exec_()
                 self.add_message("Pet", self.personality.format_response(message))
@@ -710,73 +1286,104 @@ class PetWidget(QWidget):
             message = f"Error taking screenshot: {str(e)}"
             QMessageBox.critical(self, "Screenshot Error", message)
             self.add_message("Pet", self.personality.format_response(message))
-        
+    
     def show_memory(self):
         """Show memory summary in a dialog"""
         try:
-            dialog = MemoryDialog(self.memory, self)
-            dialog.exec_()
+            # Queued interactions are written on the memory pool ahead of
+            # the dialog's load, so they still show up in the summary
+            self._flush_memory()
+            
+            # Build the dialog once; it refreshes its contents when shown
+            if self._memory_dialog is None:
+                self._memory_dialog = MemoryDialog(self.memory, self)
+            self._memory_dialog.exec_()
         except Exception as e:
             message = f"Error displaying memory: {str(e)}"
             QMessageBox.warning(self, "Memory Error", message)
             self.add_message("Pet", self.personality.format_response(message))
         
+    def on_automation_task_completed(self, task_name: str, success: bool):
+        """Report the outcome of an automation task in the chat"""
+        if success:
+            self.add_message("Pet", f"✅ Automation task '{task_name}' completed successfully!")
+        else:
+            self.add_message("Pet", f"❌ Failed to execute automation task '{task_name}'")
+    
     def show_automation(self):
         """Show automation options in a dialog"""
         try:
-            dialog = AutomationDialog(self.automation, self)
-            dialog.exec_()
+            if self._automation_dialog is None:
+                self._automation_dialog = AutomationDialog(self.automation, self)
+                self._automation_dialog.task_completed.connect(self.on_automation_task_completed)
+            else:
+                self._automation_dialog.reset_status()
+            self._automation_dialog.exec_()
         except Exception as e:
             message = f"Error displaying automation tasks: {str(e)}"
             QMessageBox.warning(self, "Automation Error", message)
             self.add_message("Pet", self.personality.format_response(message))
 
 
+def _build_tray_menu(widget: PetWidget) -> QMenu:
+    """
+    Build the tray context menu for the pet window
+    
+    The actions are created by QMenu.addAction(), so the menu owns them
+    and they are freed together with it.
+    
+    Args:
+        widget: Window the menu shows, hides and pins on top
+        
+    Returns:
+        QMenu: The populated menu
+    """
+    menu = QMenu()
+    menu.addAction("Show", widget.show)
+    menu.addAction("Hide", widget.hide)
+    on_top_action = menu.addAction("Always on Top")
+    on_top_action.setCheckable(True)
+    on_top_action.toggled.connect(widget.set_always_on_top)
+    menu.addSeparator()
+    menu.addAction("Quit", QApplication.quit)
+    return menu
+
+
 class DesktopPetApp:
     """Main application class"""
     
     def __init__(self):
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("MBTI Desktop Pet")
+        install_stylesheet()
         
         # Main widget
         self.widget = PetWidget()
-        
-        # System tray icon (optional)
-        self.create_tray_icon()
+        self.tray_icon = None
+        self.tray_menu = None
         
     def create_tray_icon(self):
-        """Create system tray icon"""
+        """Create system tray icon (skipped when the platform has no tray)"""
+        if self.tray_icon is not None or not QSystemTrayIcon.isSystemTrayAvailable():
+            return
         self.tray_icon = QSystemTrayIcon(self.app)
-        
-        # Create tray menu
-        tray_menu = QMenu()
-        
-        show_action = QAction("Show", self.app)
-        show_action.triggered.connect(self.widget.show)
-        
-        hide_action = QAction("Hide", self.app)
-        hide_action.triggered.connect(self.widget.hide)
-        
-        quit_action = QAction("Quit", self.app)
-        quit_action.triggered.connect(self.app.quit)
-        
-        tray_menu.addAction(show_action)
-        tray_menu.addAction(hide_action)
-        tray_menu.addSeparator()
-        tray_menu.addAction(quit_action)
-        
-        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_menu = _build_tray_menu(self.widget)
+        self.tray_icon.setContextMenu(self.tray_menu)
         self.tray_icon.setToolTip("MBTI Desktop Pet")
         
-        # Note: Icon would need to be set with an actual icon file
-        # self.tray_icon.setIcon(QIcon("icon.png"))
+        # Set an icon once up front; no icon file ships with the app, so
+        # reuse the pet emoji already rendered for the main window
+        self.tray_icon.setIcon(QIcon(self.widget.pet_display.pixmap()))
         
         self.tray_icon.show()
     
     def run(self):
         """Run the application"""
         self.widget.show()
+        
+        # System tray icon (optional), built after the window's first paint
+        QTimer.singleShot(0, self.create_tray_icon)
+        
         sys.exit(self.app.exec_())
 
 
@@ -10,29 +10,144 @@ from pathlib import Path
 
 # Set headless mode but allow screenshots
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+# Widgets are rendered into QImages on the CPU; never bring up a GPU context
+os.environ['QT_OPENGL'] = 'software'
 
 # Add src to path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
 from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import Qt, QPoint, QRect, QCoreApplication
+from PyQt5.QtGui import QImage, QRegion
+from PIL import Image
 from mbti_pet.config import ConfigManager
 from mbti_pet.mbti_select import MBTISelectDialog
 from mbti_pet.pet_window import PetWindow
+from mbti_pet.personality import MBTIType
+
+# Output format; SCREENSHOT_FMT=bmp skips PNG compression when only the
+# pixels matter (e.g. automated checks; transparency is not kept)
+SCREENSHOT_FORMATS = ("png", "bmp")
+SCREENSHOT_FORMAT = os.environ.get("SCREENSHOT_FMT", "png").lower()
+
+# Render target reused across screenshots of the same size
+_screenshot_buffer = None
+
+# Pillow (mode, raw mode) for the QImage formats read without conversion;
+# RGB32 pixels are native-endian 0xffRRGGBB words
+_PIL_RAW_MODES = {
+    QImage.Format_RGBA8888: ("RGBA", "RGBA"),
+    QImage.Format_RGB32: ("RGB", "BGRX" if sys.byteorder == "little" else "XRGB"),
+}
 
 def take_screenshot(widget, filename):
-    """Take a screenshot of a widget"""
-    from PyQt5.QtGui import QPixmap
-    pixmap = widget.grab()
-    pixmap.save(filename)
+    """
+    Take a screenshot of a widget
+    
+    A shown, opaque top-level window is copied in one step from the
+    platform backing store with QScreen.grabWindow(). Other widgets
+    (translucent windows, whose alpha the grab would flatten, or widgets
+    without a native window) are rendered into a reused RGBA QImage
+    instead. Either way the pixel buffer is handed straight to Pillow,
+    which encodes PNG faster than Qt's writer at a low compression level.
+    """
+    global _screenshot_buffer
+    if (widget.isVisible() and widget.windowHandle() is not None
+            and not widget.testAttribute(Qt.WA_TranslucentBackground)):
+        pixmap = QApplication.primaryScreen().grabWindow(
+            widget.winId(), 0, 0, widget.width(), widget.height()
+        )
+        if not pixmap.isNull():
+            save_image(pixmap.toImage(), filename)
+            return
+    
+    size = widget.size()
+    if _screenshot_buffer is None or _screenshot_buffer.size() != size:
+        _screenshot_buffer = QImage(size, QImage.Format_RGBA8888)
+    # Clear the previous frame; translucent widgets only paint part of it
+    _screenshot_buffer.fill(Qt.transparent)
+    widget.render(_screenshot_buffer, QPoint(0, 0), QRegion(widget.rect()))
+    
+    save_image(_screenshot_buffer, filename)
+
+def save_image(qimage, filename):
+    """
+    Encode a QImage with Pillow in SCREENSHOT_FORMAT
+    
+    RGBA8888 (rendered) and RGB32 (grabbed) buffers are read in place;
+    any other format is converted to RGBA8888 first.
+    """
+    if qimage.format() not in _PIL_RAW_MODES:
+        qimage = qimage.convertToFormat(QImage.Format_RGBA8888)
+    mode, raw_mode = _PIL_RAW_MODES[qimage.format()]
+    pixels = qimage.constBits()
+    pixels.setsize(qimage.sizeInBytes())
+    image = Image.frombuffer(
+        mode, (qimage.width(), qimage.height()), memoryview(pixels),
+        "raw", raw_mode, qimage.bytesPerLine(), 1
+    )
+    if SCREENSHOT_FORMAT == "png":
+        image.save(filename, "PNG", compress_level=1)
+    else:
+        image.save(filename, SCREENSHOT_FORMAT.upper())
     print(f"Screenshot saved: {filename}")
 
-def main():
-    app = QApplication(sys.argv)
+def take_all_pet_screenshots(config_manager, output_dir, columns=4):
+    """
+    Screenshot the pet window of every MBTI type
+    
+    All pets are rendered into one shared sheet at their grid offsets,
+    then each cell is cut out with QImage.copy(), instead of allocating
+    and clearing a separate buffer per pet.
+    """
+    cell = PetWindow.DEFAULT_SIZE
+    mbti_types = [mbti_type.value for mbti_type in MBTIType]
+    rows = (len(mbti_types) + columns - 1) // columns
+    sheet = QImage(columns * cell, rows * cell, QImage.Format_RGBA8888)
+    sheet.fill(Qt.transparent)
+    
+    for index, mbti_type in enumerate(mbti_types):
+        row, col = divmod(index, columns)
+        pet = PetWindow(mbti_type, config_manager)
+        pet.render(sheet, QPoint(col * cell, row * cell), QRegion(pet.rect()))
+        pet.close()
+    
+    for index, mbti_type in enumerate(mbti_types):
+        row, col = divmod(index, columns)
+        cell_image = sheet.copy(QRect(col * cell, row * cell, cell, cell))
+        save_image(cell_image, str(output_dir / f"pet_window_{mbti_type}.{SCREENSHOT_FORMAT}"))
+
+def settle(app, passes=3):
+    """Let pending show/layout/paint events run; offscreen has no frame timing to wait for"""
+    for _ in range(passes):
+        app.processEvents()
+
+def main(output_dir=None, all_types=False):
+    """
+    Create screenshots of the MBTI selection dialog and the pet window
+    
+    Args:
+        output_dir: Directory for the image files (defaults to the system
+            temp directory)
+        all_types: Also capture the pet window of all 16 MBTI types
+    """
+    # Fail before capturing anything rather than deep inside the encoder
+    if SCREENSHOT_FORMAT not in SCREENSHOT_FORMATS:
+        sys.exit(
+            f"Unsupported SCREENSHOT_FMT={SCREENSHOT_FORMAT!r}; "
+            f"use one of: {', '.join(SCREENSHOT_FORMATS)}"
+        )
+    
+    # Reuse the running application when called from other scripts/tests;
+    # Qt allows only one per process and start-up is the expensive part
+    app = QApplication.instance()
+    if app is None:
+        QCoreApplication.setAttribute(Qt.AA_UseSoftwareOpenGL)
+        app = QApplication(sys.argv)
     
     # Create temp config using cross-platform temp directory
-    temp_dir = Path(tempfile.gettempdir())
+    temp_dir = Path(output_dir) if output_dir else Path(tempfile.gettempdir())
     config_path = temp_dir / "test_config.json"
     config_manager = ConfigManager(str(config_path))
     
@@ -40,31 +155,28 @@ def main():
     print("Creating MBTI Selection Dialog screenshot...")
     dialog = MBTISelectDialog(config_manager)
     dialog.show()
+    settle(app)
     
-    screenshot_path = temp_dir / "mbti_select_dialog.png"
-    QTimer.singleShot(500, lambda: [
-        take_screenshot(dialog, str(screenshot_path)),
-        dialog.close()
-    ])
+    screenshot_path = temp_dir / f"mbti_select_dialog.{SCREENSHOT_FORMAT}"
+    take_screenshot(dialog, str(screenshot_path))
+    dialog.close()
     
     # Screenshot 2: Pet Window
-    def screenshot_pet():
-        print("Creating Pet Window screenshot...")
-        pet = PetWindow("ENFP", config_manager)
-        pet.show()
-        
-        pet_screenshot_path = temp_dir / "pet_window.png"
-        QTimer.singleShot(500, lambda: [
-            take_screenshot(pet, str(pet_screenshot_path)),
-            pet.close(),
-            app.quit()
-        ])
-    
-    QTimer.singleShot(1000, screenshot_pet)
-    
-    app.exec_()
+    print("Creating Pet Window screenshot...")
+    pet = PetWindow("ENFP", config_manager)
+    pet.show()
+    settle(app)
+    
+    pet_screenshot_path = temp_dir / f"pet_window.{SCREENSHOT_FORMAT}"
+    take_screenshot(pet, str(pet_screenshot_path))
+    pet.close()
+    
+    if all_types:
+        print("Creating Pet Window screenshots for all MBTI types...")
+        take_all_pet_screenshots(config_manager, temp_dir)
+    
     print("\nScreenshots created successfully!")
-    print(f"Check {temp_dir}/mbti_select_dialog.png and {temp_dir}/pet_window.png")
+    print(f"Check {screenshot_path} and {pet_screenshot_path}")
 
 if __name__ == "__main__":
-    main()
+    main(all_types="--all-types" in sys.argv[1:])
@@ -5,6 +5,7 @@ Test script to verify UI imports and basic functionality
 import sys
 from pathlib import Path
 import os
+import tempfile
 
 # Avoid display issues with PyQt5
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
@@ -27,9 +28,9 @@ except Exception as e:
 
 # Test UI module imports (may need display)
 try:
-    # Just test if the module can be parsed
-    import py_compile
-    py_compile.compile('src/mbti_pet/ui/__init__.py', doraise=True)
+    # Just test if the module can be parsed (in memory, no .pyc written)
+    ui_path = src_path / "mbti_pet" / "ui" / "__init__.py"
+    compile(ui_path.read_bytes(), str(ui_path), "exec")
     print("✅ UI module syntax is valid")
 except Exception as e:
     print(f"❌ UI module has syntax errors: {e}")
@@ -37,8 +38,11 @@ except Exception as e:
 
 print("\nTesting component initialization...")
 
+# Scratch database, removed at exit instead of being left in the working tree
+temp_dir = tempfile.TemporaryDirectory()
+
 try:
-    memory = MemoryManager("./test_memory.db")
+    memory = MemoryManager(os.path.join(temp_dir.name, "test_memory.db"))
     print("✅ MemoryManager initialized")
 except Exception as e:
     print(f"❌ MemoryManager failed: {e}")
@@ -2,13 +2,8 @@
 Tests for MBTI Desktop Pet Configuration Management
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path for imports
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
+import os
+import time
 import pytest
 import json
 import tempfile
@@ -16,6 +11,27 @@ import tempfile
 from mbti_pet.config import ConfigManager
 
 
+MBTI_TYPES = [
+    "INTJ", "INTP", "ENTJ", "ENTP",
+    "INFJ", "INFP", "ENFJ", "ENFP",
+    "ISTJ", "ISFJ", "ESTJ", "ESFJ",
+    "ISTP", "ISFP", "ESTP", "ESFP"
+]
+
+
+# Fixtures
+@pytest.fixture
+def config_path(tmp_path):
+    """Path of a config file that does not exist yet"""
+    return tmp_path / "config.json"
+
+
+@pytest.fixture
+def manager(config_path):
+    """Create a ConfigManager backed by config_path"""
+    return ConfigManager(str(config_path))
+
+
 class TestConfigManager:
     """Test ConfigManager functionality"""
     
@@ -31,18 +47,13 @@ class TestConfigManager:
         manager = ConfigManager(str(config_path))
         assert config_path.parent.exists()
     
-    def test_load_empty_config(self, tmp_path):
+    def test_load_empty_config(self, manager):
         """Test loading when config file doesn't exist"""
-        config_path = tmp_path / "config.json"
-        manager = ConfigManager(str(config_path))
         config = manager.load()
         assert config == {}
     
-    def test_save_and_load_config(self, tmp_path):
+    def test_save_and_load_config(self, manager):
         """Test saving and loading configuration"""
-        config_path = tmp_path / "config.json"
-        manager = ConfigManager(str(config_path))
-        
         test_config = {
             "mbti_type": "INTJ",
             "window_position": [100, 200]
@@ -52,11 +63,8 @@ class TestConfigManager:
         loaded_config = manager.load()
         assert loaded_config == test_config
     
-    def test_mbti_type_management(self, tmp_path):
+    def test_mbti_type_management(self, manager):
         """Test MBTI type saving and loading"""
-        config_path = tmp_path / "config.json"
-        manager = ConfigManager(str(config_path))
-        
         # Initially no MBTI type
         assert manager.get_mbti_type() is None
         
@@ -68,11 +76,8 @@ class TestConfigManager:
         assert manager.set_mbti_type("INTJ") == True
         assert manager.get_mbti_type() == "INTJ"
     
-    def test_window_position_management(self, tmp_path):
+    def test_window_position_management(self, manager):
         """Test window position saving and loading"""
-        config_path = tmp_path / "config.json"
-        manager = ConfigManager(str(config_path))
-        
         # Initially no position
         assert manager.get_window_position() is None
         
@@ -86,11 +91,8 @@ class TestConfigManager:
         position = manager.get_window_position()
         assert position == (300, 400)
     
-    def test_window_size_management(self, tmp_path):
+    def test_window_size_management(self, manager):
         """Test window size saving and loading"""
-        config_path = tmp_path / "config.json"
-        manager = ConfigManager(str(config_path))
-        
         # Initially no size
         assert manager.get_window_size() is None
         
@@ -99,22 +101,57 @@ class TestConfigManager:
         size = manager.get_window_size()
         assert size == (800, 600)
     
-    def test_corrupted_config_file(self, tmp_path):
+    def test_corrupted_config_file(self, config_path):
         """Test handling of corrupted config file"""
-        config_path = tmp_path / "config.json"
-        
         # Write invalid JSON
-        with open(config_path, 'w') as f:
-            f.write("This is not valid JSON {{{")
+        config_path.write_text("This is not valid JSON {{{", encoding="utf-8")
         
         manager = ConfigManager(str(config_path))
         config = manager.load()
         assert config == {}  # Should return empty dict on error
     
-    def test_config_persistence(self, tmp_path):
-        """Test that configuration persists across manager instances"""
-        config_path = tmp_path / "config.json"
+    def test_load_picks_up_external_changes(self, manager, config_path):
+        """Test that an edit made outside the manager is not hidden by caching"""
+        manager.set_mbti_type("ENFP")
+        assert manager.get_mbti_type() == "ENFP"
         
+        config_path.write_text('{"mbti_type": "INTJ", "pet_name": "Edited"}', encoding="utf-8")
+        assert manager.get_mbti_type() == "INTJ"
+    
+    def test_load_picks_up_same_size_edit_with_unchanged_mtime(self, manager, config_path):
+        """Test that a same-size edit is seen even if the mtime does not move"""
+        manager.set_mbti_type("INTJ")
+        stat = config_path.stat()
+        assert manager.get_mbti_type() == "INTJ"
+        
+        # Same length, then put the old timestamp back (coarse-mtime filesystems)
+        config_path.write_text(config_path.read_text(encoding="utf-8").replace("INTJ", "ENFP"), encoding="utf-8")
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert config_path.stat().st_size == stat.st_size
+        assert manager.get_mbti_type() == "ENFP"
+    
+    def test_load_caches_stable_file(self, manager, config_path, monkeypatch):
+        """Test that a file untouched for a while is parsed only once"""
+        manager.set_mbti_type("INTJ")
+        old = time.time_ns() - 10 * ConfigManager.STABLE_AFTER_NS
+        os.utime(config_path, ns=(old, old))
+        
+        parses = []
+        real_load = json.load
+        monkeypatch.setattr(json, "load", lambda f: parses.append(1) or real_load(f))
+        assert manager.get_mbti_type() == "INTJ"
+        assert manager.get_mbti_type() == "INTJ"
+        assert len(parses) == 1
+    
+    def test_load_returns_independent_copies(self, manager):
+        """Test that modifying a loaded config does not leak into later loads"""
+        manager.set_window_position(10, 20)
+        config = manager.load()
+        config["window_position"][0] = 999
+        assert manager.get_window_position() == (10, 20)
+    
+    def test_config_persistence(self, config_path):
+        """Test that configuration persists across manager instances"""
         # First manager instance
         manager1 = ConfigManager(str(config_path))
         manager1.set_mbti_type("ENTP")
@@ -125,21 +162,13 @@ class TestConfigManager:
         assert manager2.get_mbti_type() == "ENTP"
         assert manager2.get_window_position() == (100, 200)
     
-    def test_all_16_mbti_types(self, tmp_path):
-        """Test saving and loading all 16 MBTI types"""
-        config_path = tmp_path / "config.json"
-        manager = ConfigManager(str(config_path))
-        
-        mbti_types = [
-            "INTJ", "INTP", "ENTJ", "ENTP",
-            "INFJ", "INFP", "ENFJ", "ENFP",
-            "ISTJ", "ISFJ", "ESTJ", "ESFJ",
-            "ISTP", "ISFP", "ESTP", "ESFP"
-        ]
-        
-        for mbti_type in mbti_types:
-            manager.set_mbti_type(mbti_type)
-            assert manager.get_mbti_type() == mbti_type
+    # One case per type, each with its own config file, so the cases are
+    # independent and can be spread across workers (pytest-xdist: -n auto)
+    @pytest.mark.parametrize("mbti_type", MBTI_TYPES)
+    def test_all_16_mbti_types(self, manager, mbti_type):
+        """Test saving and loading each of the 16 MBTI types"""
+        assert manager.set_mbti_type(mbti_type) == True
+        assert manager.get_mbti_type() == mbti_type
 
 
 class TestPetConfig:
@@ -9,28 +9,99 @@ Comprehensive test coverage for:
 - Chinese language support
 """
 
-import pytest
 import sys
-from pathlib import Path
 
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+import pytest
 
 from mbti_pet.intent import IntentRecognizer, IntentType, ContextAwareIntentSystem, Intent
 
 
+# Test inputs, shared by the parametrized tests below
+HELP_CASES = (
+    "Can you help me with this?",
+    "I need assistance",
+    "How can you help?",
+    "帮助我",
+)
+CASUAL_CASES = (
+    "Hello!",
+    "How are you?",
+    "Good morning",
+    "Nice to meet you",
+)
+TASK_CASES = (
+    "Open the browser",
+    "Launch Chrome",
+    "Run the application",
+    "Execute this command",
+    "打开浏览器",
+)
+INFORMATION_CASES = (
+    "What is Python?",
+    "When is the deadline?",
+    "Where can I find this?",
+    "Why does this happen?",
+    "Explain machine learning",
+    "什么是人工智能？",
+)
+AUTOMATION_CASES = (
+    "Automate this task",
+    "Can you automate the backup?",
+    "Set up automation",
+)
+FILE_CASES = (
+    "Open the file",
+    "Save this document",
+    "Delete the folder",
+)
+WEB_SEARCH_CASES = (
+    "Search for Python tutorials",
+    "Look up machine learning",
+    "Find information about AI",
+)
+CONFIDENCE_CASES = (
+    "Help me with this task",
+    "Random text here",
+    "What is Python?",
+)
+LONG_INPUT = "help " * 100
+
+
+# Intent types each group of inputs may be recognized as
+HELP_INTENTS = frozenset({IntentType.HELP_REQUEST, IntentType.CASUAL_CHAT, IntentType.INFORMATION_QUERY})
+TASK_INTENTS = frozenset({IntentType.TASK_EXECUTION, IntentType.CASUAL_CHAT})
+INFORMATION_INTENTS = frozenset({IntentType.INFORMATION_QUERY, IntentType.CASUAL_CHAT})
+AUTOMATION_INTENTS = frozenset({IntentType.AUTOMATION_REQUEST, IntentType.AUTOMATION, IntentType.TASK_EXECUTION})
+WEB_SEARCH_INTENTS = frozenset({IntentType.WEB_SEARCH, IntentType.SEARCH, IntentType.INFORMATION_QUERY})
+ALL_INTENT_TYPES = frozenset(IntentType)
+
+
+# IntentRecognizer shared by the module (stateless after init)
+_RECOGNIZER = IntentRecognizer()
+
+
+def _recognize(text: str) -> Intent:
+    """
+    Recognize the intent of text with the shared recognizer
+    
+    Several tests feed the recognizer the same string; those repeats are
+    served from the recognizer's own result cache.
+    """
+    return _RECOGNIZER.recognize_intent(text)
+
+
 # Fixtures
-@pytest.fixture
-def recognizer():
-    """Create an IntentRecognizer instance for testing"""
-    return IntentRecognizer()
+@pytest.fixture(scope="session")
+def shared_context_system():
+    """Create a ContextAwareIntentSystem shared by the test session"""
+    return ContextAwareIntentSystem()
 
 
 @pytest.fixture
-def context_system():
-    """Create a ContextAwareIntentSystem instance for testing"""
-    return ContextAwareIntentSystem()
+def context_system(shared_context_system):
+    """Shared ContextAwareIntentSystem reset to a clean activity history"""
+    shared_context_system.reset()
+    return shared_context_system
 
 
 # Test Intent Recognition - Basic Intents
@@ -38,142 +109,100 @@ def context_system():
 class TestBasicIntents:
     """Test basic intent recognition"""
     
-    def test_help_request_intent(self, recognizer):
+    @pytest.mark.parametrize("test_input", HELP_CASES)
+    def test_help_request_intent(self, test_input):
         """Test help request recognition"""
-        test_cases = [
-            "Can you help me with this?",
-            "I need assistance",
-            "How can you help?",
-            "帮助我",
-        ]
-        for test_input in test_cases:
-            intent = recognizer.recognize_intent(test_input)
-            assert intent.intent_type in [IntentType.HELP_REQUEST, IntentType.CASUAL_CHAT, IntentType.INFORMATION_QUERY]
-            assert intent.confidence > 0.0
-            assert intent.raw_input == test_input
-    
-    def test_casual_chat_intent(self, recognizer):
+        intent = _recognize(test_input)
+        assert intent.intent_type in HELP_INTENTS
+        assert intent.confidence > 0.0
+        assert intent.raw_input == test_input
+    
+    @pytest.mark.parametrize("test_input", CASUAL_CASES)
+    def test_casual_chat_intent(self, test_input):
         """Test casual chat recognition"""
-        test_cases = [
-            "Hello!",
-            "How are you?",
-            "Good morning",
-            "Nice to meet you",
-        ]
-        for test_input in test_cases:
-            intent = recognizer.recognize_intent(test_input)
-            # These should default to casual chat if no other patterns match
-            assert intent.intent_type == IntentType.CASUAL_CHAT
-            assert intent.confidence >= 0.0
-    
-    def test_task_execution_intent(self, recognizer):
+        intent = _recognize(test_input)
+        # These should default to casual chat if no other patterns match
+        assert intent.intent_type == IntentType.CASUAL_CHAT
+        assert intent.confidence >= 0.0
+    
+    @pytest.mark.parametrize("test_input", TASK_CASES)
+    def test_task_execution_intent(self, test_input):
         """Test task execution recognition"""
-        test_cases = [
-            "Open the browser",
-            "Launch Chrome",
-            "Run the application",
-            "Execute this command",
-            "打开浏览器",
-        ]
-        for test_input in test_cases:
-            intent = recognizer.recognize_intent(test_input)
-            assert intent.intent_type in [IntentType.TASK_EXECUTION, IntentType.CASUAL_CHAT]
-            assert intent.confidence > 0.0
-    
-    def test_information_query_intent(self, recognizer):
+        intent = _recognize(test_input)
+        assert intent.intent_type in TASK_INTENTS
+        assert intent.confidence > 0.0
+    
+    @pytest.mark.parametrize("test_input", INFORMATION_CASES)
+    def test_information_query_intent(self, test_input):
         """Test information query recognition"""
-        test_cases = [
-            "What is Python?",
-            "When is the deadline?",
-            "Where can I find this?",
-            "Why does this happen?",
-            "Explain machine learning",
-            "什么是人工智能？",
-        ]
-        for test_input in test_cases:
-            intent = recognizer.recognize_intent(test_input)
-            assert intent.intent_type in [IntentType.INFORMATION_QUERY, IntentType.CASUAL_CHAT]
-            assert intent.confidence > 0.0
+        intent = _recognize(test_input)
+        assert intent.intent_type in INFORMATION_INTENTS
+        assert intent.confidence > 0.0
 
 
 @pytest.mark.intent
 class TestAdvancedIntents:
     """Test advanced intent types"""
     
-    def test_automation_request_intent(self, recognizer):
+    @pytest.mark.parametrize("test_input", AUTOMATION_CASES)
+    def test_automation_request_intent(self, test_input):
         """Test automation request recognition"""
-        test_cases = [
-            "Automate this task",
-            "Can you automate the backup?",
-            "Set up automation",
-        ]
-        for test_input in test_cases:
-            intent = recognizer.recognize_intent(test_input)
-            assert intent.intent_type in [IntentType.AUTOMATION_REQUEST, IntentType.AUTOMATION, IntentType.TASK_EXECUTION]
-            assert intent.confidence > 0.0
-    
-    def test_file_operation_intent(self, recognizer):
+        intent = _recognize(test_input)
+        assert intent.intent_type in AUTOMATION_INTENTS
+        assert intent.confidence > 0.0
+    
+    @pytest.mark.parametrize("test_input", FILE_CASES)
+    def test_file_operation_intent(self, test_input):
         """Test file operation recognition"""
-        test_cases = [
-            "Open the file",
-            "Save this document",
-            "Delete the folder",
-        ]
-        for test_input in test_cases:
-            intent = recognizer.recognize_intent(test_input)
-            # File operations might be detected as various types
-            assert intent.confidence > 0.0
-    
-    def test_web_search_intent(self, recognizer):
+        intent = _recognize(test_input)
+        # File operations might be detected as various types
+        assert intent.confidence > 0.0
+    
+    @pytest.mark.parametrize("test_input", WEB_SEARCH_CASES)
+    def test_web_search_intent(self, test_input):
         """Test web search recognition"""
-        test_cases = [
-            "Search for Python tutorials",
-            "Look up machine learning",
-            "Find information about AI",
-        ]
-        for test_input in test_cases:
-            intent = recognizer.recognize_intent(test_input)
-            assert intent.intent_type in [IntentType.WEB_SEARCH, IntentType.SEARCH, IntentType.INFORMATION_QUERY]
-            assert intent.confidence > 0.0
+        intent = _recognize(test_input)
+        assert intent.intent_type in WEB_SEARCH_INTENTS
+        assert intent.confidence > 0.0
 
 
 @pytest.mark.intent
 class TestEntityExtraction:
     """Test entity extraction from user input"""
     
-    def test_file_path_extraction(self, recognizer):
+    def test_file_path_extraction(self):
         """Test extraction of file paths"""
-        intent = recognizer.recognize_intent("Open the file 'test.py'")
+        intent = _recognize("Open the file 'test.py'")
         assert "file_path" in intent.entities
         assert "test.py" in intent.entities["file_path"]
     
-    def test_url_extraction(self, recognizer):
+    def test_url_extraction(self):
         """Test extraction of URLs"""
-        intent = recognizer.recognize_intent("Visit https://example.com")
+        intent = _recognize("Visit https://example.com")
         assert "url" in intent.entities
         assert "https://example.com" in intent.entities["url"]
     
-    def test_email_extraction(self, recognizer):
+    def test_email_extraction(self):
         """Test extraction of email addresses"""
-        intent = recognizer.recognize_intent("Send email to test@example.com")
+        intent = _recognize("Send email to test@example.com")
         assert "email" in intent.entities
         assert "test@example.com" in intent.entities["email"]
     
-    def test_number_extraction(self, recognizer):
+    def test_number_extraction(self):
         """Test extraction of numbers"""
-        intent = recognizer.recognize_intent("Set timer for 30 minutes")
+        intent = _recognize("Set timer for 30 minutes")
         assert "number" in intent.entities
         assert "30" in intent.entities["number"]
     
-    def test_time_extraction(self, recognizer):
+    def test_time_extraction(self):
         """Test extraction of time values"""
-        intent = recognizer.recognize_intent("Schedule meeting at 14:30")
+        intent = _recognize("Schedule meeting at 14:30")
         assert "time" in intent.entities
         assert "14:30" in intent.entities["time"]
     
-    def test_multiple_entities(self, recognizer):
+    def test_multiple_entities(self):
         """Test extraction of multiple entities"""
-        intent = recognizer.recognize_intent("Send 'report.pdf' to admin@company.com at 10:00")
+        intent = _recognize("Send 'report.pdf' to admin@company.com at 10:00")
         # Should extract at least one entity
         assert len(intent.entities) > 0
 
@@ -188,7 +217,7 @@ class TestContextAwareRecognition:
             user_input="Help me",
             window_title="Visual Studio Code"
         )
-        assert intent.intent_type in list(IntentType)
+        assert intent.intent_type in ALL_INTENT_TYPES
         assert "activity_type" in intent.entities
         assert intent.entities["activity_type"] == "coding"
     
@@ -198,7 +227,7 @@ class TestContextAwareRecognition:
             user_input="Search for this",
             window_title="Google Chrome"
         )
-        assert intent.intent_type in list(IntentType)
+        assert intent.intent_type in ALL_INTENT_TYPES
         assert "activity_type" in intent.entities
         assert intent.entities["activity_type"] == "web_browsing"
     
@@ -208,58 +237,80 @@ class TestContextAwareRecognition:
             user_input="Check grammar",
             window_title="Microsoft Word"
         )
-        assert intent.intent_type in list(IntentType)
+        assert intent.intent_type in ALL_INTENT_TYPES
         assert "activity_type" in intent.entities
         assert intent.entities["activity_type"] == "writing"
     
+    @pytest.mark.parametrize("window_title, activity_type", (
+        ("Google Docs - Chrome", "web_browsing"),
+        ("Budget.xlsx - Excel", "spreadsheet"),
+        ("Untitled - Notepad", "writing"),
+        ("Terminal", "unknown"),
+    ))
+    def test_window_title_activity(self, context_system, window_title, activity_type):
+        """Test window title classification, including keyword precedence"""
+        analysis = context_system.screen_analyzer.analyze_window_title(window_title)
+        assert analysis["activity_type"] == activity_type
+    
     def test_context_without_input(self, context_system):
         """Test context analysis without user input"""
         intent = context_system.analyze(window_title="PyCharm")
         assert intent.intent_type == IntentType.UNKNOWN
         assert "activity_type" in intent.entities
+    
+    def test_reset_clears_activity_history(self, context_system):
+        """Test that reset forgets previously seen screen activity"""
+        for _ in range(3):
+            context_system.analyze(window_title="PyCharm")
+        assert context_system.screen_analyzer.detect_pattern() is not None
+        context_system.reset()
+        assert context_system.screen_analyzer.activity_history == []
+        assert context_system.screen_analyzer.detect_pattern() is None
 
 
 @pytest.mark.intent
 class TestEdgeCases:
     """Test edge cases and error handling"""
     
-    def test_empty_input(self, recognizer):
+    def test_empty_input(self):
         """Test handling of empty input"""
-        intent = recognizer.recognize_intent("")
+        intent = _recognize("")
         assert intent.intent_type == IntentType.CASUAL_CHAT
         assert intent.confidence >= 0.0
     
-    def test_very_long_input(self, recognizer):
+    def test_very_long_input(self):
         """Test handling of very long input"""
-        long_input = "help " * 100
-        intent = recognizer.recognize_intent(long_input)
-        assert intent.intent_type in list(IntentType)
+        intent = _recognize(LONG_INPUT)
+        assert intent.intent_type in ALL_INTENT_TYPES
         assert intent.confidence > 0.0
     
-    def test_special_characters(self, recognizer):
+    def test_special_characters(self):
         """Test handling of special characters"""
-        intent = recognizer.recognize_intent("!@#$%^&*()")
+        intent = _recognize("!@#$%^&*()")
         assert intent.intent_type == IntentType.CASUAL_CHAT
     
-    def test_mixed_language(self, recognizer):
+    @pytest.mark.parametrize("test_input", ("HELP ME", "Search For Python", "OPEN THE BROWSER"))
+    def test_case_insensitive(self, test_input):
+        """Test that upper and mixed case input matches like lower case"""
+        intent = _recognize(test_input)
+        lower = _recognize(test_input.lower())
+        assert intent.intent_type == lower.intent_type
+        assert intent.confidence == lower.confidence
+    
+    def test_mixed_language(self):
         """Test handling of mixed Chinese and English"""
-        intent = recognizer.recognize_intent("帮我 open file 文件")
-        assert intent.intent_type in list(IntentType)
+        intent = _recognize("帮我 open file 文件")
+        assert intent.intent_type in ALL_INTENT_TYPES
     
-    def test_confidence_score_range(self, recognizer):
+    @pytest.mark.parametrize("test_input", CONFIDENCE_CASES)
+    def test_confidence_score_range(self, test_input):
         """Test that confidence scores are in valid range"""
-        test_cases = [
-            "Help me with this task",
-            "Random text here",
-            "What is Python?",
-        ]
-        for test_input in test_cases:
-            intent = recognizer.recognize_intent(test_input)
-            assert 0.0 <= intent.confidence <= 1.0
-    
-    def test_suggested_action_exists(self, recognizer):
+        intent = _recognize(test_input)
+        assert 0.0 <= intent.confidence <= 1.0
+    
+    def test_suggested_action_exists(self):
         """Test that suggested actions are generated"""
-        intent = recognizer.recognize_intent("Help me")
+        intent = _recognize("Help me")
         assert intent.suggested_action is not None
         assert len(intent.suggested_action) > 0
 
@@ -268,55 +319,22 @@ class TestEdgeCases:
 class TestIntentDataClass:
     """Test Intent data class"""
     
-    def test_intent_structure(self, recognizer):
+    def test_intent_structure(self):
         """Test that Intent object has correct structure"""
-        intent = recognizer.recognize_intent("Help me")
+        intent = _recognize("Help me")
         assert hasattr(intent, 'intent_type')
         assert hasattr(intent, 'confidence')
         assert hasattr(intent, 'entities')
         assert hasattr(intent, 'raw_input')
         assert intent.raw_input == "Help me"
-
-
-
-# Test can be run with pytest
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
-    test_task_execution_intent()
-    test_information_query_intent()
-    test_search_intent()
-    test_automation_intent()
-    test_memory_intent()
-    test_screenshot_intent()
-    test_open_url_intent()
-    test_open_file_intent()
-    test_casual_chat_intent()
-    test_code_assistance_intent()
-    test_entity_extraction()
-    test_chinese_input()
-    test_context_aware_system()
-    test_confidence_scores()
-    test_edge_cases()
-    
-    print("=" * 80)
-    print("All tests passed! ✓")
-    print("\nIntent Recognition Accuracy Test Summary:")
-    print("- Help Request: ✓")
-    print("- Task Execution: ✓")
-    print("- Information Query: ✓")
-    print("- Search: ✓")
-    print("- Automation: ✓")
-    print("- Memory: ✓")
-    print("- Screenshot: ✓")
-    print("- Open URL: ✓")
-    print("- Open File: ✓")
-    print("- Casual Chat: ✓")
-    print("- Code Assistance: ✓")
-    print("- Chinese Language Support: ✓")
-    print("- Context Awareness: ✓")
-    print("- Confidence Scores: ✓")
-    print("- Edge Cases: ✓")
-
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_intent_slots(self):
+        """Test that Intent instances use slots instead of a __dict__"""
+        intent = _recognize("Help me")
+        assert hasattr(Intent, "__slots__")
+        assert not hasattr(intent, "__dict__")
+    
     def test_intent_creation(self):
         """Test creating Intent instances"""
         intent = Intent(
@@ -333,6 +351,61 @@ if __name__ == "__main__":
         assert intent.suggested_action == "Test action"
 
 
+
+@pytest.mark.intent
+class TestRecognitionCache:
+    """Test caching of recognition results"""
+    
+    def test_cache_hit_returns_equal_intent(self):
+        """Test that repeated calls return equal, separate intents"""
+        recognizer = IntentRecognizer()
+        first = recognizer.recognize_intent("Open the file 'test.py'")
+        second = recognizer.recognize_intent("Open the file 'test.py'")
+        assert first == second
+        assert first is not second
+        assert recognizer._recognize_text.cache_info().hits == 1
+    
+    def test_cached_entities_not_shared(self):
+        """Test that modifying a result does not change later results"""
+        recognizer = IntentRecognizer()
+        first = recognizer.recognize_intent("Set timer for 30 minutes")
+        first.entities["number"].append("99")
+        first.entities["extra"] = True
+        second = recognizer.recognize_intent("Set timer for 30 minutes")
+        assert second.entities == {"number": ["30"]}
+    
+    def test_context_not_cached(self):
+        """Test that context only applies to the call it was passed to"""
+        recognizer = IntentRecognizer()
+        with_context = recognizer.recognize_intent("Help me", {"activity_type": "coding"})
+        without_context = recognizer.recognize_intent("Help me")
+        assert with_context.entities["activity_type"] == "coding"
+        assert "activity_type" not in without_context.entities
+    
+    def test_recognize_batch_matches_single_calls(self):
+        """Test that batch results equal one-at-a-time recognition"""
+        inputs = list(HELP_CASES + TASK_CASES) + [HELP_CASES[0]]
+        intents = IntentRecognizer().recognize_batch(inputs)
+        assert intents == [_recognize(test_input) for test_input in inputs]
+        assert intents[0] is not intents[-1]
+    
+    @pytest.mark.parametrize("test_input", ("", "   ", "!@#$%^&*()", "?!", "..."))
+    def test_no_word_input_skips_matching(self, test_input):
+        """Test that input without word characters falls back without matching"""
+        recognizer = IntentRecognizer()
+        intent = recognizer.recognize_intent(test_input)
+        intent_type, confidence, entities = recognizer._recognize_text_uncached(test_input)
+        assert (intent.intent_type, intent.confidence, intent.entities) == (intent_type, confidence, {})
+        assert recognizer._recognize_text.cache_info().misses == 0
+    
+    def test_clear_cache(self):
+        """Test that clear_cache drops cached results"""
+        recognizer = IntentRecognizer()
+        recognizer.recognize_intent("Help me")
+        recognizer.clear_cache()
+        assert recognizer._recognize_text.cache_info().currsize == 0
+
+
 # Run tests directly
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
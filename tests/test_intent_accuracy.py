@@ -6,9 +6,11 @@ Tests accuracy with a diverse set of realistic inputs
 import sys
 from pathlib import Path
 
-# Add src to path
+# Add src to path when run directly (pytest's conftest.py or an
+# editable install already provide it)
 src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 from mbti_pet.intent import IntentRecognizer, IntentType
 
@@ -114,8 +116,9 @@ def calculate_accuracy():
     print("Testing Intent Recognition Accuracy...")
     print("=" * 90)
     
-    for test_input, expected_intent in TEST_DATASET:
-        result = recognizer.recognize_intent(test_input)
+    results = recognizer.recognize_batch([test_input for test_input, _ in TEST_DATASET])
+    
+    for (test_input, expected_intent), result in zip(TEST_DATASET, results):
         
         # Handle cases where multiple intents are acceptable
         if isinstance(expected_intent, list):
@@ -12,14 +12,8 @@ Comprehensive test coverage for:
 """
 
 import pytest
-import sys
 import os
 import tempfile
-from pathlib import Path
-
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
 
 from mbti_pet.memory import MemoryManager, MemoryEntry, MemoryDatabase
 
@@ -64,6 +58,20 @@ class TestMemoryInitialization:
         # Database should be initialized with tables
         count = memory_db.get_memory_count()
         assert count == 0  # No memories yet, but table exists
+    
+    def test_revision_tracks_writes(self, memory_manager):
+        """Test that the database revision changes on every write"""
+        assert memory_manager.db.revision == 0
+        
+        memory_manager.record_interaction("text_input", "Hello")
+        assert memory_manager.db.revision == 1
+        
+        memory_manager.learn_pattern("task", {"name": "backup"})
+        assert memory_manager.db.revision == 2
+        
+        # Reads don't change the revision
+        memory_manager.get_summary()
+        assert memory_manager.db.revision == 2
 
 
 @pytest.mark.memory
@@ -93,6 +101,25 @@ class TestMemoryRecording:
         count = memory_manager.db.get_memory_count()
         assert count == 5
     
+    def test_record_interactions_batch(self, memory_manager):
+        """Test recording a batch of interactions in one transaction"""
+        entries = [
+            memory_manager.create_entry("text_input", "Question", importance=7),
+            memory_manager.create_entry("response", "Answer", importance=5),
+        ]
+        memory_manager.record_interactions(entries)
+        
+        assert memory_manager.db.get_memory_count() == 2
+        assert memory_manager.db.revision == 1
+        contents = {m.content for m in memory_manager.db.get_recent_memories(limit=2)}
+        assert contents == {"Question", "Answer"}
+    
+    def test_record_interactions_empty_batch(self, memory_manager):
+        """Test that an empty batch is a no-op"""
+        memory_manager.record_interactions([])
+        assert memory_manager.db.get_memory_count() == 0
+        assert memory_manager.db.revision == 0
+    
     def test_record_with_context(self, memory_manager):
         """Test recording interaction with context"""
         context = {"window": "VS Code", "activity": "coding"}
@@ -0,0 +1,80 @@
+"""
+Performance benchmarks for the Intent Recognition System
+
+Timing coverage for the hot paths:
+- recognize_intent on cached and uncached input
+- Entity extraction on long input
+- Batch recognition
+
+Requires pytest-benchmark. The tests are marked slow, so they only run
+when selected, e.g. pytest tests/test_performance.py -m slow
+"""
+
+import importlib.util
+
+import pytest
+
+from mbti_pet.intent import IntentRecognizer, IntentType
+
+
+# Benchmarks take far longer than the unit tests; keep them out of the
+# default run, and skip them when selected without the plugin
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        importlib.util.find_spec("pytest_benchmark") is None,
+        reason="pytest-benchmark is not installed"
+    ),
+]
+
+SAMPLE_INPUT = "Help me debug this function"
+# Long input that hits every entity pattern
+LONG_ENTITY_INPUT = "Send 'report.pdf' to admin@company.com at 10:00, see https://example.com " * 20
+BATCH_INPUTS = (
+    "Can you help me with this?",
+    "Open the browser",
+    "What is Python?",
+    "Search for Python tutorials",
+    "帮助我",
+    "Hello!",
+) * 10
+
+
+# Fixtures
+@pytest.fixture(scope="module")
+def recognizer():
+    """Create an IntentRecognizer shared by the module"""
+    return IntentRecognizer()
+
+
+@pytest.mark.intent
+class TestRecognitionPerformance:
+    """Benchmark intent recognition"""
+
+    def test_recognize_intent_cached(self, benchmark, recognizer):
+        """Benchmark recognition of a repeated input (result cache hit)"""
+        intent = benchmark(recognizer.recognize_intent, SAMPLE_INPUT)
+        assert intent.intent_type in set(IntentType)
+
+    def test_recognize_intent_uncached(self, benchmark, recognizer):
+        """Benchmark full pattern matching (cache cleared before each round)"""
+        intent = benchmark.pedantic(
+            recognizer.recognize_intent, args=(SAMPLE_INPUT,),
+            setup=recognizer.clear_cache, rounds=500
+        )
+        assert intent.intent_type in set(IntentType)
+
+    def test_extract_entities_long_input(self, benchmark, recognizer):
+        """Benchmark entity extraction on long input"""
+        entities = benchmark(recognizer._extract_entities, LONG_ENTITY_INPUT)
+        assert set(entities) == {"file_path", "url", "email", "number", "time"}
+
+    def test_recognize_batch(self, benchmark, recognizer):
+        """Benchmark batch recognition with repeated inputs"""
+        intents = benchmark(recognizer.recognize_batch, BATCH_INPUTS)
+        assert len(intents) == len(BATCH_INPUTS)
+
+
+# Run tests directly
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-m", "slow"])
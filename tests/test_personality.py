@@ -12,12 +12,6 @@ Comprehensive test coverage for:
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add src to path
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
 
 from mbti_pet.personality import MBTIPersonality, MBTIType, PersonalityTraits
 
@@ -231,6 +225,14 @@ class TestResponseFormatting:
         formatted = personality.format_response(message)
         assert message in formatted
 
+    def test_compiled_template_matches_format_response(self):
+        """Test that the compiled template formats like format_response"""
+        for mbti_type in MBTIType:
+            personality = MBTIPersonality(mbti_type)
+            prefix, suffix = personality.compiled_template()
+            message = "Template check"
+            assert f"{prefix}{message}{suffix}" == personality.format_response(message)
+
 
 @pytest.mark.personality
 class TestPersonalityDescription:
@@ -9,9 +9,11 @@ from pathlib import Path
 # Set environment for headless testing
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
 
-# Add src to path
+# Add src to path when run directly (pytest's conftest.py or an
+# editable install already provide it)
 src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 
 def test_imports():
@@ -5,15 +5,10 @@ Tests that components can be instantiated (UI tests in headless environment)
 
 import sys
 import os
-from pathlib import Path
 
 # Set up headless Qt for testing
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
 
-# Add src to path for imports
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 import pytest
 from PyQt5.QtWidgets import QApplication
 
@@ -21,6 +16,9 @@ from mbti_pet.config import ConfigManager
 from mbti_pet.mbti_select import MBTISelectDialog
 from mbti_pet.pet_window import PetWindow
 
+# Every test here needs a QApplication; keep them out of the default run
+pytestmark = pytest.mark.slow
+
 
 @pytest.fixture(scope="module")
 def qapp():